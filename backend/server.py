@@ -1,34 +1,292 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, File, Header, Query, Request, Response, UploadFile, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel, ReturnDocument, UpdateOne, monitoring
+from pymongo.read_preferences import SecondaryPreferred
+from pymongo.errors import BulkWriteError, CollectionInvalid, DuplicateKeyError, OperationFailure
 import os
+import asyncio
+import shutil
+import tempfile
+import threading
+import base64
+import contextvars
+import bisect
+import hashlib
+import json
 import logging
+import re
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from pydantic import BaseModel, Field
-from typing import List, Optional, Union
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from pydantic import BaseModel, Field, ValidationError, model_validator
+from typing import Callable, List, Optional, Union
 import uuid
 from datetime import datetime, timedelta, timezone
 import jwt
 import bcrypt
+import numpy as np
+import orjson
+import pandas as pd
 from enum import Enum
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
+# Metrics, exposed in Prometheus text format at /api/metrics
+metrics_registry = CollectorRegistry()
+http_requests_total = Counter(
+    "joblens_http_requests_total", "HTTP requests by route and status",
+    ["method", "route", "status"], registry=metrics_registry
+)
+http_request_duration = Histogram(
+    "joblens_http_request_duration_seconds", "HTTP request latency by route",
+    ["method", "route"], registry=metrics_registry
+)
+http_requests_in_progress = Gauge(
+    "joblens_http_requests_in_progress", "HTTP requests currently being handled",
+    ["method"], registry=metrics_registry
+)
+mongo_commands_per_request = Histogram(
+    "joblens_mongo_commands_per_request", "MongoDB commands issued while handling one request",
+    ["route"], buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 250), registry=metrics_registry
+)
+mongo_seconds_per_request = Histogram(
+    "joblens_mongo_seconds_per_request", "Time spent in MongoDB commands while handling one request",
+    ["route"], registry=metrics_registry
+)
+mongo_commands_total = Counter(
+    "joblens_mongo_commands_total", "MongoDB commands by command name and outcome",
+    ["command", "outcome"], registry=metrics_registry
+)
+
+mongo_pool_checkout_wait = Histogram(
+    "joblens_mongo_pool_checkout_wait_seconds", "Time spent waiting to check a connection out of the Mongo pool",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5), registry=metrics_registry
+)
+mongo_pool_checkout_failures = Counter(
+    "joblens_mongo_pool_checkout_failures_total", "Failed Mongo pool checkouts by reason",
+    ["reason"], registry=metrics_registry
+)
+mongo_pool_connections = Gauge(
+    "joblens_mongo_pool_connections", "Mongo pool connections by state",
+    ["state"], registry=metrics_registry
+)
+
+# Durations (seconds) of the Mongo commands issued by the request being handled. Motor runs
+# pymongo calls in a copy of the caller's context, so the listener sees the request's list.
+request_mongo_durations = contextvars.ContextVar("request_mongo_durations", default=None)
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """Counts every command and charges its duration to the request that issued it"""
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        self._record(event, "succeeded")
+
+    def failed(self, event):
+        self._record(event, "failed")
+
+    def _record(self, event, outcome: str):
+        mongo_commands_total.labels(event.command_name, outcome).inc()
+        durations = request_mongo_durations.get()
+        if durations is not None:
+            durations.append(event.duration_micros / 1e6)
+
+class MongoPoolMetrics(monitoring.ConnectionPoolListener):
+    """Times pool checkouts and tracks open and in-use connections"""
+    def __init__(self):
+        # A checkout runs start to finish on one executor thread; this pymongo has no event durations
+        self._checkout = threading.local()
+
+    def connection_check_out_started(self, event):
+        self._checkout.started_at = time.perf_counter()
+
+    def connection_checked_out(self, event):
+        mongo_pool_checkout_wait.observe(time.perf_counter() - self._checkout.started_at)
+        mongo_pool_connections.labels("in_use").inc()
+
+    def connection_check_out_failed(self, event):
+        mongo_pool_checkout_wait.observe(time.perf_counter() - self._checkout.started_at)
+        mongo_pool_checkout_failures.labels(event.reason).inc()
+
+    def connection_checked_in(self, event):
+        mongo_pool_connections.labels("in_use").dec()
+
+    def connection_created(self, event):
+        mongo_pool_connections.labels("open").inc()
+
+    def connection_closed(self, event):
+        mongo_pool_connections.labels("open").dec()
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
 # MongoDB connection
-mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
-db = client[os.environ['DB_NAME']]
+class MongoSettings(BaseModel):
+    """Motor client options, read from MONGO_* environment variables"""
+    url: str
+    db_name: str
+    # Every option defaults to None, which leaves it to the connection string and then the driver default;
+    # pymongo lets keyword arguments override URI options, so only environment-set values are passed
+    app_name: Optional[str] = None
+    max_pool_size: Optional[int] = None
+    min_pool_size: Optional[int] = None
+    max_connecting: Optional[int] = None
+    max_idle_time_ms: Optional[int] = None
+    wait_queue_timeout_ms: Optional[int] = None
+    # In preference order, e.g. zstd,snappy,zlib; zstd needs zstandard and snappy needs python-snappy
+    compressors: Optional[List[str]] = None
+    zlib_compression_level: Optional[int] = None
+    server_selection_timeout_ms: Optional[int] = None
+    connect_timeout_ms: Optional[int] = None
+    socket_timeout_ms: Optional[int] = None
+    read_concern: Optional[str] = None  # local, majority, ...; server default when unset
+    write_concern_w: Optional[Union[int, str]] = None
+    write_concern_journal: Optional[bool] = None
+    write_concern_timeout_ms: Optional[int] = None
+    # Bound on replication lag for reads routed to secondaries (MongoDB requires at least 90s); -1 for no bound
+    secondary_max_staleness_seconds: int = 90
+
+    @classmethod
+    def from_env(cls) -> "MongoSettings":
+        env = {
+            "app_name": "MONGO_APP_NAME",
+            "max_pool_size": "MONGO_MAX_POOL_SIZE",
+            "min_pool_size": "MONGO_MIN_POOL_SIZE",
+            "max_connecting": "MONGO_MAX_CONNECTING",
+            "max_idle_time_ms": "MONGO_MAX_IDLE_TIME_MS",
+            "wait_queue_timeout_ms": "MONGO_WAIT_QUEUE_TIMEOUT_MS",
+            "zlib_compression_level": "MONGO_ZLIB_COMPRESSION_LEVEL",
+            "server_selection_timeout_ms": "MONGO_SERVER_SELECTION_TIMEOUT_MS",
+            "connect_timeout_ms": "MONGO_CONNECT_TIMEOUT_MS",
+            "socket_timeout_ms": "MONGO_SOCKET_TIMEOUT_MS",
+            "read_concern": "MONGO_READ_CONCERN",
+            "write_concern_journal": "MONGO_WRITE_CONCERN_JOURNAL",
+            "write_concern_timeout_ms": "MONGO_WRITE_CONCERN_TIMEOUT_MS",
+            "secondary_max_staleness_seconds": "MONGO_SECONDARY_MAX_STALENESS_SECONDS"
+        }
+        values = {field: os.environ[name] for field, name in env.items() if os.environ.get(name)}
+        if os.environ.get('MONGO_COMPRESSORS'):
+            values["compressors"] = [name.strip() for name in os.environ['MONGO_COMPRESSORS'].split(',') if name.strip()]
+        if os.environ.get('MONGO_WRITE_CONCERN_W'):
+            w = os.environ['MONGO_WRITE_CONCERN_W']
+            values["write_concern_w"] = int(w) if w.isdigit() else w
+        return cls(url=os.environ['MONGO_URL'], db_name=os.environ['DB_NAME'], **values)
+
+    def client_options(self) -> dict:
+        options = {
+            "appname": self.app_name,
+            "maxPoolSize": self.max_pool_size,
+            "minPoolSize": self.min_pool_size,
+            "maxConnecting": self.max_connecting,
+            "maxIdleTimeMS": self.max_idle_time_ms,
+            "waitQueueTimeoutMS": self.wait_queue_timeout_ms,
+            "zlibCompressionLevel": self.zlib_compression_level,
+            "serverSelectionTimeoutMS": self.server_selection_timeout_ms,
+            "connectTimeoutMS": self.connect_timeout_ms,
+            "socketTimeoutMS": self.socket_timeout_ms,
+            "readConcernLevel": self.read_concern,
+            "w": self.write_concern_w,
+            "journal": self.write_concern_journal,
+            "wTimeoutMS": self.write_concern_timeout_ms
+        }
+        if self.compressors:
+            options["compressors"] = ",".join(self.compressors)
+        return {name: value for name, value in options.items() if value is not None}
+
+mongo_settings = MongoSettings.from_env()
+client = AsyncIOMotorClient(
+    mongo_settings.url,
+    event_listeners=[MongoCommandMetrics(), MongoPoolMetrics()],
+    **mongo_settings.client_options()
+)
+db = client[mongo_settings.db_name]
+# Search and dashboard reads tolerate bounded staleness and may be served by secondaries. Anything that
+# must see the caller's own writes (profiles, applications, recruiter pipelines) reads through db, on the primary,
+# as do full rebuilds of in-process indexes that are patched on writes (skill snapshots, college autocomplete).
+replica_db = client.get_database(
+    mongo_settings.db_name,
+    read_preference=SecondaryPreferred(max_staleness=mongo_settings.secondary_max_staleness_seconds)
+)
+
+async def warm_up_mongo_pool():
+    """Open min_pool_size connections up front so the first burst of requests doesn't pay for connection setup"""
+    min_pool_size = client.delegate.options.pool_options.min_pool_size
+    await asyncio.gather(*(client.admin.command("ping") for _ in range(max(min_pool_size, 1))))
 
 # JWT Configuration
 JWT_SECRET = os.environ.get('JWT_SECRET', 'your-secret-key-change-in-production')
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRATION_HOURS = 24
 
+# Password hashing pool configuration
+PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', min(os.cpu_count() or 1, 4)))
+PASSWORD_HASH_MAX_QUEUE = int(os.environ.get('PASSWORD_HASH_MAX_QUEUE', 64))
+PASSWORD_HASH_EXECUTOR = os.environ.get('PASSWORD_HASH_EXECUTOR', 'thread')  # thread or process
+
+# Authenticated principal cache configuration
+PRINCIPAL_CACHE_TTL_SECONDS = float(os.environ.get('PRINCIPAL_CACHE_TTL_SECONDS', 60))
+PRINCIPAL_CACHE_SIZE = int(os.environ.get('PRINCIPAL_CACHE_SIZE', 10000))
+
+# Each worker picks up logouts handled by other workers within this many seconds
+REVOKED_TOKENS_SYNC_SECONDS = float(os.environ.get('REVOKED_TOKENS_SYNC_SECONDS', 5))
+# Re-read revocations this far behind the last sync, covering clock skew between workers
+REVOKED_TOKENS_SYNC_OVERLAP = timedelta(seconds=60)
+
+# Admin analytics
+ANALYTICS_CACHE_TTL_SECONDS = float(os.environ.get('ANALYTICS_CACHE_TTL_SECONDS', 30))
+ACTIVITY_FEED_MAX_ENTRIES = int(os.environ.get('ACTIVITY_FEED_MAX_ENTRIES', 1000))
+
+# Bulk job posting limits
+BULK_INSERT_CHUNK_SIZE = int(os.environ.get('BULK_INSERT_CHUNK_SIZE', 1000))
+BULK_JOBS_MAX_ITEMS = int(os.environ.get('BULK_JOBS_MAX_ITEMS', 50000))
+
+# Admin CSV imports
+IMPORT_CHUNK_SIZE = int(os.environ.get('IMPORT_CHUNK_SIZE', 1000))
+IMPORT_HASH_WORKERS = int(os.environ.get('IMPORT_HASH_WORKERS', os.cpu_count() or 1))
+IMPORT_MAX_ERRORS = 100
+
+# Status transitions kept per application
+STATUS_HISTORY_LIMIT = 20
+
+# Response cache for public list endpoints; the TTL bounds staleness from writes handled by other workers
+RESPONSE_CACHE_TTL_SECONDS = float(os.environ.get('RESPONSE_CACHE_TTL_SECONDS', 30))
+RESPONSE_CACHE_SIZE = int(os.environ.get('RESPONSE_CACHE_SIZE', 1000))
+
+# College autocomplete index is fully rebuilt after this many seconds
+COLLEGE_INDEX_MAX_AGE_SECONDS = float(os.environ.get('COLLEGE_INDEX_MAX_AGE_SECONDS', 300))
+
+# In-memory skill snapshots are fully rebuilt after this many seconds, incremental updates in between
+SKILL_SNAPSHOT_MAX_AGE_SECONDS = float(os.environ.get('SKILL_SNAPSHOT_MAX_AGE_SECONDS', 300))
+SKILL_SNAPSHOT_BATCH_SIZE = 10000
+
 # Create the main app without a prefix
-app = FastAPI(title="JobLens API", description="Connecting students with recruiters through verified skills")
+app = FastAPI(
+    title="JobLens API",
+    description="Connecting students with recruiters through verified skills",
+    default_response_class=ORJSONResponse
+)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -46,12 +304,27 @@ class JobType(str, Enum):
     INTERNSHIP = "internship"
     FULLTIME = "fulltime"
 
+class ApplicationStatus(str, Enum):
+    APPLIED = "applied"
+    SHORTLISTED = "shortlisted"
+    INTERVIEWING = "interviewing"
+    OFFERED = "offered"
+    HIRED = "hired"
+    REJECTED = "rejected"
+
+class SkillMatch(str, Enum):
+    ANY = "any"
+    ALL = "all"
+
 class YearLevel(str, Enum):
     FIRST = "1st"
     SECOND = "2nd"
     THIRD = "3rd"
     FINAL = "final"
 
+def normalize_college(name: str) -> str:
+    return " ".join(name.split()).lower()
+
 # Models
 class User(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -70,6 +343,12 @@ class Student(BaseModel):
     year_of_passout: int
     completed_skills: List[str] = []
     phone: Optional[str] = None
+    college_key: Optional[str] = None  # normalized college, for indexed prefix search
+
+    @model_validator(mode="after")
+    def derive_college_key(self):
+        self.college_key = normalize_college(self.college)
+        return self
     
 class Recruiter(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -106,9 +385,38 @@ class Application(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     student_id: str
     job_id: str
-    status: str = "applied"
+    status: ApplicationStatus = ApplicationStatus.APPLIED
     applied_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
+class ImportKind(str, Enum):
+    STUDENTS = "students"
+    JOBS = "jobs"
+
+class ImportStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+class ImportJob(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    kind: ImportKind
+    filename: Optional[str] = None
+    status: ImportStatus = ImportStatus.QUEUED
+    processed: int = 0
+    inserted: int = 0
+    failed: int = 0
+    errors: List[dict] = []  # first IMPORT_MAX_ERRORS row errors
+    error: Optional[str] = None  # set when the import as a whole failed
+    created_by: str
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    finished_at: Optional[datetime] = None
+
+# Projections for trusted reads: documents written by this app already match the model,
+# so list endpoints fetch only the response fields and skip re-validation
+COURSE_PROJECTION = {"_id": 0, **{field: 1 for field in Course.model_fields}}
+JOB_PROJECTION = {"_id": 0, **{field: 1 for field in Job.model_fields}}
+
 # Request/Response Models
 class UserCreate(BaseModel):
     email: str
@@ -152,6 +460,145 @@ class StudentSearch(BaseModel):
     college: Optional[str] = None
     year_of_passout: Optional[int] = None
     skills: Optional[List[str]] = None
+    skill_match: SkillMatch = SkillMatch.ANY
+
+class ApplicationStatusUpdate(BaseModel):
+    application_ids: List[str] = Field(min_length=1, max_length=1000)
+    status: ApplicationStatus
+
+class Principal(BaseModel):
+    user_id: str
+    role: UserRole
+    name: str
+    email: str
+    is_verified: bool = False
+    profile_id: Optional[str] = None  # student or recruiter profile id, once created
+
+# Index registry, applied idempotently at startup
+INDEXES = {
+    "users": [
+        IndexModel([("email", ASCENDING)], unique=True),
+        IndexModel([("id", ASCENDING)], unique=True),
+        IndexModel([("created_at", ASCENDING), ("id", ASCENDING)])
+    ],
+    "students": [
+        IndexModel([("id", ASCENDING)], unique=True),
+        IndexModel([("user_id", ASCENDING)], unique=True),
+        IndexModel([("year_of_passout", ASCENDING)]),
+        IndexModel([("college_key", ASCENDING), ("year_of_passout", ASCENDING)])
+    ],
+    "recruiters": [
+        IndexModel([("id", ASCENDING)], unique=True),
+        IndexModel([("user_id", ASCENDING)], unique=True)
+    ],
+    "courses": [
+        IndexModel([("id", ASCENDING)], unique=True),
+        IndexModel([("skill_name", ASCENDING)])
+    ],
+    "jobs": [
+        IndexModel([("id", ASCENDING)], unique=True),
+        # get_jobs filters on any of job_type/year_level/experience_level and pages by (created_at, id)
+        IndexModel([("created_at", DESCENDING), ("id", DESCENDING)]),
+        IndexModel([("job_type", ASCENDING), ("created_at", DESCENDING), ("id", DESCENDING)]),
+        IndexModel([("year_level", ASCENDING), ("created_at", DESCENDING), ("id", DESCENDING)]),
+        IndexModel([("experience_level", ASCENDING), ("created_at", DESCENDING), ("id", DESCENDING)]),
+        IndexModel([("job_type", ASCENDING), ("year_level", ASCENDING), ("created_at", DESCENDING), ("id", DESCENDING)]),
+        IndexModel([("job_type", ASCENDING), ("experience_level", ASCENDING), ("created_at", DESCENDING), ("id", DESCENDING)]),
+        # Keyword search, ranked by weighted relevance
+        IndexModel(
+            [("title", TEXT), ("company", TEXT), ("location", TEXT), ("description", TEXT)],
+            weights={"title": 10, "company": 5, "location": 3, "description": 1},
+            name="jobs_text"
+        )
+    ],
+    "skills": [
+        IndexModel([("key", ASCENDING)], unique=True),
+        IndexModel([("bit", ASCENDING)], unique=True)
+    ],
+    "imports": [
+        IndexModel([("id", ASCENDING)], unique=True)
+    ],
+    "revoked_tokens": [
+        IndexModel([("jti", ASCENDING)], unique=True),
+        IndexModel([("revoked_at", ASCENDING)]),
+        # Entries are useless once the token would have expired anyway
+        IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0)
+    ],
+    "applications": [
+        IndexModel([("id", ASCENDING)], unique=True),
+        IndexModel([("student_id", ASCENDING), ("job_id", ASCENDING)], unique=True),
+        # Recruiter applicant pipeline pages by (applied_at, id) within a job, optionally per status
+        IndexModel([("job_id", ASCENDING), ("applied_at", DESCENDING), ("id", DESCENDING)]),
+        IndexModel([("job_id", ASCENDING), ("status", ASCENDING), ("applied_at", DESCENDING), ("id", DESCENDING)])
+    ]
+}
+
+JOBS_SORT = [("created_at", DESCENDING), ("id", DESCENDING)]
+JOB_SEARCH_SORT = [("score", DESCENDING), ("created_at", DESCENDING), ("id", DESCENDING)]
+APPLICANTS_SORT = [("applied_at", DESCENDING), ("id", DESCENDING)]
+
+# Hot query shapes that must be served by an index (checked by verify_query_plans)
+QUERY_SHAPES = [
+    {"name": "user by email", "collection": "users", "filter": {"email": "a@example.com"}},
+    {"name": "user by id", "collection": "users", "filter": {"id": "x"}},
+    {"name": "admin user page", "collection": "users", "filter": {}, "sort": [("created_at", ASCENDING), ("id", ASCENDING)]},
+    {"name": "student by user_id", "collection": "students", "filter": {"user_id": "x"}},
+    {"name": "students by passout year", "collection": "students", "filter": {"year_of_passout": 2026}},
+    {"name": "students by college prefix", "collection": "students", "filter": {"college_key": {"$regex": "^iit"}}},
+    {"name": "recruiter by user_id", "collection": "recruiters", "filter": {"user_id": "x"}},
+    {"name": "course by skill", "collection": "courses", "filter": {"skill_name": "Python"}},
+    {"name": "job by id", "collection": "jobs", "filter": {"id": "x"}},
+    {"name": "job feed", "collection": "jobs", "filter": {}, "sort": JOBS_SORT},
+    {"name": "job feed next page", "collection": "jobs", "filter": {"$or": [{"created_at": {"$lt": datetime(2025, 1, 1)}}, {"created_at": datetime(2025, 1, 1), "id": {"$lt": "x"}}]}, "sort": JOBS_SORT},
+    {"name": "job feed by type", "collection": "jobs", "filter": {"job_type": "internship"}, "sort": JOBS_SORT},
+    {"name": "job feed by year", "collection": "jobs", "filter": {"year_level": "3rd"}, "sort": JOBS_SORT},
+    {"name": "job feed by experience", "collection": "jobs", "filter": {"experience_level": "fresher"}, "sort": JOBS_SORT},
+    {"name": "job feed by type and year", "collection": "jobs", "filter": {"job_type": "internship", "year_level": "3rd"}, "sort": JOBS_SORT},
+    {"name": "job feed by type and experience", "collection": "jobs", "filter": {"job_type": "fulltime", "experience_level": "fresher"}, "sort": JOBS_SORT},
+    {"name": "job keyword search", "collection": "jobs", "filter": {"$text": {"$search": "python developer"}}},
+    {"name": "revoked tokens since", "collection": "revoked_tokens", "filter": {"revoked_at": {"$gte": datetime(2025, 1, 1)}}},
+    {"name": "application by student and job", "collection": "applications", "filter": {"student_id": "x", "job_id": "y"}},
+    {"name": "applications by student", "collection": "applications", "filter": {"student_id": "x"}},
+    {"name": "applicants by job", "collection": "applications", "filter": {"job_id": "x"}, "sort": APPLICANTS_SORT},
+    {"name": "applicants by job and status", "collection": "applications", "filter": {"job_id": "x", "status": "shortlisted"}, "sort": APPLICANTS_SORT}
+]
+
+async def ensure_indexes():
+    for collection_name, indexes in INDEXES.items():
+        try:
+            await db[collection_name].create_indexes(indexes)
+        except OperationFailure as exc:
+            # Usually existing duplicates blocking a unique index; keep serving and surface it loudly
+            logger.error("Failed to create indexes on %s: %s", collection_name, exc)
+
+def _plan_stages(plan) -> set:
+    stages = set()
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            stages.add(plan["stage"])
+        for value in plan.values():
+            stages |= _plan_stages(value)
+    elif isinstance(plan, list):
+        for value in plan:
+            stages |= _plan_stages(value)
+    return stages
+
+async def verify_query_plans() -> List[dict]:
+    """explain() every registered query shape and report the winning plan's stages"""
+    report = []
+    for shape in QUERY_SHAPES:
+        cursor = db[shape["collection"]].find(shape["filter"])
+        if shape.get("sort"):
+            cursor = cursor.sort(shape["sort"])
+        explanation = await cursor.explain()
+        stages = _plan_stages(explanation["queryPlanner"]["winningPlan"])
+        report.append({
+            "name": shape["name"],
+            "collection": shape["collection"],
+            "stages": sorted(stages),
+            "collscan": "COLLSCAN" in stages
+        })
+    return report
 
 # Utility Functions
 def hash_password(password: str) -> str:
@@ -160,10 +607,164 @@ def hash_password(password: str) -> str:
 def verify_password(password: str, hashed: str) -> bool:
     return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
 
+def _timed_call(fn, *args):
+    return time.monotonic(), fn(*args)
+
+class PasswordHashingPool:
+    """Runs bcrypt off the event loop with a bounded backlog. When saturated, request-path callers are shed
+    with 503s; with shed_load=False (background imports) callers wait for a slot instead."""
+    def __init__(self, workers: int, max_queue: int, executor: str = "thread", shed_load: bool = True):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.executor_kind = executor
+        self.shed_load = shed_load
+        self._executor = None
+        self._slots = asyncio.Semaphore(workers + max_queue)
+        self._in_flight = 0
+        self._waiting = 0
+        self._recent_waits = deque(maxlen=1000)
+        self.completed = 0
+        self.rejected = 0
+        self.wait_seconds_total = 0.0
+
+    def _get_executor(self):
+        if self._executor is None:
+            executor_cls = ProcessPoolExecutor if self.executor_kind == "process" else ThreadPoolExecutor
+            self._executor = executor_cls(max_workers=self.workers)
+        return self._executor
+
+    @property
+    def queue_depth(self) -> int:
+        return max(self._in_flight - self.workers, 0)
+
+    async def run(self, fn, *args):
+        if self.shed_load and self._slots.locked():
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authentication is busy, please retry",
+                headers={"Retry-After": "1"}
+            )
+        
+        submitted_at = time.monotonic()
+        self._waiting += 1
+        async with self._slots:
+            self._waiting -= 1
+            self._in_flight += 1
+            try:
+                started_at, result = await asyncio.get_running_loop().run_in_executor(
+                    self._get_executor(), _timed_call, fn, *args
+                )
+            finally:
+                self._in_flight -= 1
+        
+        wait_seconds = max(started_at - submitted_at, 0.0)
+        self._recent_waits.append(wait_seconds)
+        self.wait_seconds_total += wait_seconds
+        self.completed += 1
+        return result
+
+    def stats(self) -> dict:
+        waits = sorted(self._recent_waits)
+        return {
+            "executor": self.executor_kind,
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "in_flight": self._in_flight,
+            "queue_depth": self.queue_depth,
+            "waiting": self._waiting,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "wait_ms_avg": round(self.wait_seconds_total / self.completed * 1000, 2) if self.completed else 0.0,
+            "wait_ms_p95": round(waits[min(int(len(waits) * 0.95), len(waits) - 1)] * 1000, 2) if waits else 0.0
+        }
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+password_pool = PasswordHashingPool(PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_QUEUE, PASSWORD_HASH_EXECUTOR)
+# Separate process pool for bulk imports so an import can't starve interactive logins; concurrent
+# imports queue behind each other rather than failing
+import_password_pool = PasswordHashingPool(IMPORT_HASH_WORKERS, IMPORT_CHUNK_SIZE, "process", shed_load=False)
+
+class TTLCache:
+    """Small in-process LRU cache whose entries expire after `ttl` seconds"""
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key, value):
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+class RevokedTokens:
+    """Token ids revoked before their natural expiry, shared through the revoked_tokens collection and mirrored
+    in each worker, which pulls new revocations at most every REVOKED_TOKENS_SYNC_SECONDS"""
+    def __init__(self):
+        self._expiry = {}
+        self._synced_through = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def revoke(self, token_id: str, expires_at: float):
+        expires = datetime.fromtimestamp(expires_at, timezone.utc)
+        await db.revoked_tokens.update_one(
+            {"jti": token_id},
+            {"$setOnInsert": {"revoked_at": datetime.now(timezone.utc), "expires_at": expires}},
+            upsert=True
+        )
+        self._expiry[token_id] = expires
+
+    async def _sync(self):
+        started_at = datetime.now(timezone.utc)
+        if self._synced_through is None:
+            query = {"expires_at": {"$gt": started_at}}
+        else:
+            query = {"revoked_at": {"$gte": self._synced_through - REVOKED_TOKENS_SYNC_OVERLAP}}
+        async for doc in db.revoked_tokens.find(query, {"_id": 0, "jti": 1, "expires_at": 1}):
+            self._expiry[doc["jti"]] = doc["expires_at"].replace(tzinfo=timezone.utc)
+        self._expiry = {jti: expires for jti, expires in self._expiry.items() if expires > started_at}
+        self._synced_through = started_at
+
+    async def is_revoked(self, token_id: Optional[str]) -> bool:
+        if token_id in self._expiry:
+            return True
+        if time.monotonic() - self._checked_at >= REVOKED_TOKENS_SYNC_SECONDS:
+            async with self._lock:
+                if time.monotonic() - self._checked_at >= REVOKED_TOKENS_SYNC_SECONDS:
+                    await self._sync()
+                    self._checked_at = time.monotonic()
+        return token_id in self._expiry
+
+principal_cache = TTLCache(PRINCIPAL_CACHE_SIZE, PRINCIPAL_CACHE_TTL_SECONDS)
+revoked_tokens = RevokedTokens()
+
 def create_jwt_token(user_id: str, role: str) -> str:
     payload = {
         "user_id": user_id,
         "role": role,
+        "jti": uuid.uuid4().hex,
         "exp": datetime.now(timezone.utc) + timedelta(hours=JWT_EXPIRATION_HOURS)
     }
     return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
@@ -175,12 +776,648 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
         role = payload.get("role")
         if not user_id:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
-        return {"user_id": user_id, "role": role}
+        if await revoked_tokens.is_revoked(payload.get("jti")):
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token revoked")
+        return {"user_id": user_id, "role": role, "token_id": payload.get("jti"), "expires_at": payload.get("exp")}
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token expired")
     except jwt.InvalidTokenError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
+# Keyset pagination cursors
+def encode_cursor(*values) -> str:
+    """Encode the sort-key values of the last returned document as an opaque token"""
+    payload = [{"$date": value.isoformat()} if isinstance(value, datetime) else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode('utf-8')).decode('utf-8').rstrip("=")
+
+def decode_cursor(cursor: str) -> list:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return [datetime.fromisoformat(value["$date"]) if isinstance(value, dict) else value for value in payload]
+    except (ValueError, TypeError, KeyError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def keyset_filter(sort_fields: List[str], values: list, descending: bool = False) -> dict:
+    """Match documents strictly after `values` in the (sort_fields...) ordering"""
+    if len(values) != len(sort_fields):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    op = "$lt" if descending else "$gt"
+    clauses = []
+    for i, field in enumerate(sort_fields):
+        clause = {sort_fields[j]: values[j] for j in range(i)}
+        clause[field] = {op: values[i]}
+        clauses.append(clause)
+    return {"$or": clauses}
+
+# Response cache
+def serialize_with_etag(value) -> tuple:
+    """JSON body and a weak ETag derived from it"""
+    body = orjson.dumps(value, default=jsonable_encoder)
+    return 'W/"%s"' % hashlib.sha1(body).hexdigest()[:20], body
+
+def splice_sections(sections: dict, known_etags: set) -> bytes:
+    """JSON object of {name: {"etag", "data"}} from (etag, serialized body) sections, with {"etag", "not_modified": true}
+    in place of sections whose ETag is known. Bodies are already serialized, so they are spliced in rather than
+    decoded and re-encoded."""
+    parts = []
+    for name, (etag, body) in sections.items():
+        if etag in known_etags:
+            section = orjson.dumps({"etag": etag, "not_modified": True})
+        else:
+            section = orjson.dumps({"etag": etag})[:-1] + b',"data":' + body + b"}"
+        parts.append(orjson.dumps(name) + b":" + section)
+    return b"{" + b",".join(parts) + b"}"
+
+class ResponseCache:
+    """Serialized responses keyed by route and query params, invalidated by bumping a per-namespace version"""
+    def __init__(self, maxsize: int, ttl: float):
+        self._versions = {}
+        self._entries = TTLCache(maxsize, ttl)
+
+    def bump(self, *namespaces: str):
+        for namespace in namespaces:
+            self._versions[namespace] = self._versions.get(namespace, 0) + 1
+
+    async def entry(self, namespace: str, key: tuple, build) -> tuple:
+        """(etag, serialized body) for the key, built and cached on a miss"""
+        # Keyed by the version seen before building, so a write landing mid-build can't be cached as current
+        cache_key = (namespace, self._versions.get(namespace, 0), key)
+        entry = self._entries.get(cache_key)
+        if entry is None:
+            entry = serialize_with_etag(await build())
+            self._entries.set(cache_key, entry)
+        return entry
+
+    async def respond(self, namespace: str, key: tuple, if_none_match: Optional[str], build) -> Response:
+        etag, body = await self.entry(namespace, key, build)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+response_cache = ResponseCache(RESPONSE_CACHE_SIZE, RESPONSE_CACHE_TTL_SECONDS)
+
+# Skill dictionary
+def normalize_skill(name: str) -> str:
+    return " ".join(name.split()).casefold()
+
+def skill_mask(bits) -> bytes:
+    """Pack bit positions into BinData-compatible bytes (bit 0 is the low bit of the first byte, as $bitsAllSet expects)"""
+    value = 0
+    for bit in bits:
+        value |= 1 << bit
+    return value.to_bytes(max((value.bit_length() + 7) // 8, 1), "little")
+
+def skill_name_pattern(name: str) -> re.Pattern:
+    """Case-insensitive regex matching the spellings of a skill name that normalize_skill maps to the same key"""
+    return re.compile(r"^\s*" + r"\s+".join(re.escape(word) for word in name.split()) + r"\s*$", re.IGNORECASE)
+
+class SkillRegistry:
+    """Canonical skill dictionary assigning each course skill a stable bit position, persisted in the skills collection.
+    Only admin-defined skills are registered; free-text skills from students, jobs and imports never get a bit."""
+    def __init__(self):
+        self._bits = {}
+
+    async def load(self):
+        async for doc in db.skills.find({}, {"_id": 0, "key": 1, "bit": 1}):
+            self._bits[doc["key"]] = doc["bit"]
+
+    async def lookup(self, names: List[str]) -> List[Optional[int]]:
+        """Bit positions for already-registered skills, None for unknown ones"""
+        keys = [normalize_skill(name) for name in names]
+        if any(key not in self._bits for key in keys):
+            # Another worker may have registered it since we last loaded
+            await self.load()
+        return [self._bits.get(key) for key in keys]
+
+    async def ensure(self, names: List[str]) -> List[str]:
+        """Register canonical skills (course skill names) that have no bit yet, returning the ones this call registered"""
+        names_by_key = {normalize_skill(name): name for name in names}
+        registered = []
+        if any(key not in self._bits for key in names_by_key):
+            await self.load()
+        for key, name in names_by_key.items():
+            if key in self._bits:
+                continue
+            counter = await db.counters.find_one_and_update(
+                {"_id": "skill_bit"},
+                {"$inc": {"seq": 1}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+            bit = counter["seq"] - 1
+            try:
+                await db.skills.insert_one({"key": key, "name": name, "bit": bit})
+                registered.append(name)
+            except DuplicateKeyError:
+                # Lost a registration race; the winner's bit is canonical
+                bit = (await db.skills.find_one({"key": key}))["bit"]
+            self._bits[key] = bit
+        return registered
+
+    async def mask(self, names: List[str]) -> bytes:
+        """Mask of the registered skills among `names`"""
+        return skill_mask([bit for bit in await self.lookup(names) if bit is not None])
+
+    def known_bits(self, names: List[str]) -> List[int]:
+        """Bit positions from the in-memory dictionary only, skipping unknown skills"""
+        return [self._bits[key] for key in {normalize_skill(name) for name in names} if key in self._bits]
+
+skill_registry = SkillRegistry()
+
+async def backfill_derived_fields(batch_size: int = 1000, skills: Optional[List[str]] = None) -> dict:
+    """Recompute fields derived from other document fields (skill masks, college keys) for existing documents,
+    or only for documents listing one of `skills`, e.g. after a new course gives those skills a bit"""
+    course_skills = await db.courses.distinct("skill_name")
+    await skill_registry.ensure(course_skills)
+    skill_patterns = [skill_name_pattern(skill) for skill in skills] if skills else None
+    
+    async def student_fields(doc):
+        return {
+            "skill_mask": await skill_registry.mask(doc.get("completed_skills", [])),
+            "college_key": normalize_college(doc["college"])
+        }
+    
+    async def job_fields(doc):
+        return {"required_skill_mask": await skill_registry.mask(doc.get("required_skills", []))}
+    
+    counts = {}
+    for collection_name, source_fields, derive in [
+        ("students", ["completed_skills", "college"], student_fields),
+        ("jobs", ["required_skills"], job_fields)
+    ]:
+        collection = db[collection_name]
+        # The skills field is listed first
+        query = {source_fields[0]: {"$in": skill_patterns}} if skill_patterns else {}
+        updated = 0
+        batch = []
+        async for doc in collection.find(query, {"_id": 0, "id": 1, **{field: 1 for field in source_fields}}):
+            batch.append(UpdateOne({"id": doc["id"]}, {"$set": await derive(doc)}))
+            if len(batch) == batch_size:
+                updated += (await collection.bulk_write(batch, ordered=False)).modified_count
+                batch = []
+        if batch:
+            updated += (await collection.bulk_write(batch, ordered=False)).modified_count
+        counts[collection_name] = updated
+    return counts
+
+async def refresh_skill_masks(skills: List[str]):
+    """Give students and jobs that already list newly registered skills their bits"""
+    try:
+        counts = await backfill_derived_fields(skills=skills)
+        logger.info("Refreshed skill masks for %s: %s", skills, counts)
+    except Exception:
+        logger.exception("Refreshing skill masks for %s failed; run the backfill command", skills)
+
+# College autocomplete
+class CollegeIndex:
+    """Distinct normalized colleges kept sorted for bisect prefix ranges, with aligned student counts. After
+    COLLEGE_INDEX_MAX_AGE_SECONDS it is rebuilt in a background task while requests keep using the current index."""
+    def __init__(self):
+        self.keys = []
+        self.counts = np.zeros(0, dtype=np.int64)
+        self.names = {}
+        self.built_at = None
+        self._lock = asyncio.Lock()
+        self._rebuild = None
+        self._pending = None  # colleges added while a rebuild is aggregating the collection
+
+    async def ensure_fresh(self):
+        if self.built_at is None:
+            async with self._lock:
+                if self.built_at is None:
+                    await self._build()
+        elif time.monotonic() - self.built_at >= COLLEGE_INDEX_MAX_AGE_SECONDS and self._rebuild is None:
+            self._rebuild = asyncio.create_task(self._background_rebuild())
+
+    async def _background_rebuild(self):
+        try:
+            async with self._lock:
+                await self._build()
+        except Exception:
+            logger.exception("Rebuilding the college index failed; keeping the previous one")
+            self.built_at = time.monotonic()  # retry after another full interval
+        finally:
+            self._rebuild = None
+
+    async def _build(self):
+        self._pending = []
+        try:
+            groups = await db.students.aggregate([
+                {"$group": {
+                    "_id": {"$ifNull": ["$college_key", {"$toLower": {"$trim": {"input": "$college"}}}]},
+                    "name": {"$first": "$college"},
+                    "count": {"$sum": 1}
+                }},
+                {"$sort": {"_id": 1}}
+            ]).to_list(None)
+            self.keys = [group["_id"] for group in groups]
+            self.counts = np.array([group["count"] for group in groups], dtype=np.int64)
+            self.names = {group["_id"]: " ".join(group["name"].split()) for group in groups}
+            self.built_at = time.monotonic()
+            # Replay students added while aggregating; one the aggregation already saw is counted twice until the next rebuild
+            for college in self._pending:
+                self._insert(college)
+        finally:
+            self._pending = None
+
+    def add(self, college: str):
+        if self._pending is not None:
+            self._pending.append(college)
+        if self.built_at is not None:
+            self._insert(college)
+
+    def _insert(self, college: str):
+        key = normalize_college(college)
+        position = bisect.bisect_left(self.keys, key)
+        if position == len(self.keys) or self.keys[position] != key:
+            self.keys.insert(position, key)
+            self.counts = np.insert(self.counts, position, 0)
+            self.names[key] = " ".join(college.split())
+        self.counts[position] += 1
+
+    def complete(self, prefix: str, limit: int) -> List[dict]:
+        prefix = normalize_college(prefix)
+        start = bisect.bisect_left(self.keys, prefix)
+        end = bisect.bisect_left(self.keys, prefix + "\uffff")
+        top = start + top_k(self.counts[start:end], limit)
+        return [{"college": self.names[self.keys[position]], "count": int(self.counts[position])} for position in top]
+
+college_index = CollegeIndex()
+
+# Activity feed and analytics
+ANALYTICS_COLLECTIONS = ["users", "students", "recruiters", "courses", "jobs", "applications"]
+RECENT_ACTIVITY_LIMIT = 10
+
+analytics_cache = TTLCache(1, ANALYTICS_CACHE_TTL_SECONDS)
+
+async def ensure_activity_collection():
+    """Create the capped activity collection backing the admin feed"""
+    try:
+        await db.create_collection("activity", capped=True, size=ACTIVITY_FEED_MAX_ENTRIES * 512, max=ACTIVITY_FEED_MAX_ENTRIES)
+    except CollectionInvalid:
+        pass  # already exists
+
+async def record_activity(activity_type: str, message: str):
+    await db.activity.insert_one({"type": activity_type, "message": message, "timestamp": datetime.now(timezone.utc)})
+
+async def compute_stats() -> dict:
+    """Collection totals in one concurrent batch of metadata counts, persisted to the stats document"""
+    counts = await asyncio.gather(*(replica_db[name].estimated_document_count() for name in ANALYTICS_COLLECTIONS))
+    stats = {f"total_{name}": count for name, count in zip(ANALYTICS_COLLECTIONS, counts)}
+    await db.stats.update_one(
+        {"_id": "totals"},
+        {"$set": {**stats, "computed_at": datetime.now(timezone.utc)}},
+        upsert=True
+    )
+    return stats
+
+async def load_stats() -> dict:
+    # Other workers refresh the shared stats document too, so only recompute once it is stale
+    stats_doc = await replica_db.stats.find_one({"_id": "totals"}, {"_id": 0})
+    if stats_doc:
+        computed_at = stats_doc.pop("computed_at").replace(tzinfo=timezone.utc)
+        if datetime.now(timezone.utc) - computed_at < timedelta(seconds=ANALYTICS_CACHE_TTL_SECONDS):
+            return stats_doc
+    return await compute_stats()
+
+# Skill-vector snapshots
+YEAR_LEVEL_STUDY_YEAR = {YearLevel.FIRST: 1, YearLevel.SECOND: 2, YearLevel.THIRD: 3, YearLevel.FINAL: 4}
+
+def current_passout_year(today: Optional[datetime] = None) -> int:
+    # Academic years end in June; final-year students pass out when the current one ends
+    today = today or datetime.now(timezone.utc)
+    return today.year if today.month <= 6 else today.year + 1
+
+def study_years(year_of_passout, today: Optional[datetime] = None):
+    """Current year of study for passout year(s): 1-4 in college, 5 once graduated, 0 if not yet enrolled"""
+    return np.clip(4 - (np.asarray(year_of_passout) - current_passout_year(today)), 0, 5)
+
+def year_fit(study_year, job: dict):
+    """How well students' years of study fit a job: 1.0 exact, 0.5 adjacent or partial, 0.0 ineligible"""
+    study_year = np.asarray(study_year)
+    in_college = (study_year >= 1) & (study_year <= 4)
+    if job.get("job_type") == JobType.FULLTIME:
+        # Full-time roles are open to final-year students and graduates; experienced roles to graduates only
+        if job.get("experience_level") == "experienced":
+            return np.where(study_year == 5, 1.0, 0.0)
+        return np.where(study_year >= 4, 1.0, 0.0)
+    if job.get("year_level"):
+        distance = np.abs(study_year - YEAR_LEVEL_STUDY_YEAR[YearLevel(job["year_level"])])
+        return np.where(in_college & (distance == 0), 1.0, np.where(in_college & (distance == 1), 0.5, 0.0))
+    return np.where(in_college, 1.0, np.where(study_year == 5, 0.5, 0.0))
+
+def skill_words(bits: List[int], width: int) -> np.ndarray:
+    value = 0
+    for bit in bits:
+        value |= 1 << int(bit)
+    return np.frombuffer(value.to_bytes(width * 8, "little"), dtype="<u8").astype(np.uint64)
+
+class SkillMatrix:
+    """Packed skill bit vectors, one row per document, for vectorized overlap counts"""
+    def __init__(self, columns: dict):
+        self.ids = []
+        self.rows = {}
+        self.size = 0
+        self.width = 1
+        self.words = np.zeros((0, self.width), dtype=np.uint64)
+        self.skill_counts = np.zeros(0, dtype=np.int32)
+        self.active = np.zeros(0, dtype=bool)
+        self.columns = {name: np.zeros(0, dtype=dtype) for name, dtype in columns.items()}
+
+    def _reserve(self, rows: int, width: int):
+        capacity = len(self.active)
+        if rows > capacity or width > self.width:
+            new_capacity = max(rows, capacity * 2 if rows > capacity else capacity, 16)
+            new_width = max(width, self.width)
+            words = np.zeros((new_capacity, new_width), dtype=np.uint64)
+            words[:capacity, :self.width] = self.words
+            self.words = words
+            self.width = new_width
+            self.skill_counts = np.concatenate([self.skill_counts, np.zeros(new_capacity - capacity, dtype=np.int32)])
+            self.active = np.concatenate([self.active, np.zeros(new_capacity - capacity, dtype=bool)])
+            for name, column in self.columns.items():
+                self.columns[name] = np.concatenate([column, np.zeros(new_capacity - capacity, dtype=column.dtype)])
+
+    def upsert(self, doc_id: str, bits: List[int], **values):
+        row = self.rows.get(doc_id)
+        if row is None:
+            row = self.size
+            self.rows[doc_id] = row
+            self.ids.append(doc_id)
+            self.size += 1
+        self._reserve(self.size, (max(bits) >> 6) + 1 if bits else 1)
+        self.words[row] = skill_words(bits, self.width)
+        self.skill_counts[row] = len(set(bits))
+        self.active[row] = True
+        for name, value in values.items():
+            self.columns[name][row] = value
+
+    def upsert_many(self, doc_ids: List[str], bits: List[List[int]], values: dict):
+        """Batch upsert: packs every row's skill words with one scatter instead of one skill_words call per row"""
+        rows = []
+        for doc_id in doc_ids:
+            row = self.rows.get(doc_id)
+            if row is None:
+                row = self.size
+                self.rows[doc_id] = row
+                self.ids.append(doc_id)
+                self.size += 1
+            rows.append(row)
+        rows = np.asarray(rows, dtype=np.int64)
+        lengths = np.fromiter((len(row_bits) for row_bits in bits), dtype=np.int64, count=len(bits))
+        flat_bits = np.fromiter((bit for row_bits in bits for bit in row_bits), dtype=np.int64, count=int(lengths.sum()))
+        self._reserve(self.size, int(flat_bits.max() >> 6) + 1 if len(flat_bits) else 1)
+        
+        words = np.zeros((len(rows), self.width), dtype=np.uint64)
+        np.bitwise_or.at(
+            words,
+            (np.repeat(np.arange(len(rows)), lengths), flat_bits >> 6),
+            np.left_shift(np.uint64(1), (flat_bits & 63).astype(np.uint64))
+        )
+        self.words[rows] = words
+        self.skill_counts[rows] = np.bitwise_count(words).sum(axis=1, dtype=np.int32)
+        self.active[rows] = True
+        for name, column in values.items():
+            self.columns[name][rows] = column
+
+    def remove(self, doc_id: str):
+        row = self.rows.get(doc_id)
+        if row is not None:
+            self.active[row] = False
+
+    def vector(self, bits: List[int]) -> np.ndarray:
+        self._reserve(self.size, (max(bits) >> 6) + 1 if bits else 1)
+        return skill_words(bits, self.width)
+
+    def overlap(self, vector: np.ndarray) -> np.ndarray:
+        """Number of bits each row shares with `vector`"""
+        return np.bitwise_count(self.words[:self.size] & vector).sum(axis=1, dtype=np.int32)
+
+class SkillSnapshot:
+    """A SkillMatrix over one collection, patched incrementally on writes. After SKILL_SNAPSHOT_MAX_AGE_SECONDS
+    it is rebuilt in a background task while requests keep using the current matrix."""
+    def __init__(self, collection_name: str, skills_field: str, columns: dict, fields: List[str], encode: Callable[[dict], dict]):
+        self.collection_name = collection_name
+        self.skills_field = skills_field
+        self.column_types = columns
+        self.fields = fields
+        self.encode = encode
+        self.matrix = None
+        self.built_at = 0.0
+        self._lock = asyncio.Lock()
+        self._rebuild = None
+        self._pending = None  # patches received while a rebuild is reading the collection
+
+    def _row(self, doc: dict):
+        return skill_registry.known_bits(doc.get(self.skills_field, [])), self.encode(doc)
+
+    async def get(self) -> SkillMatrix:
+        if self.matrix is None:
+            async with self._lock:
+                if self.matrix is None:
+                    await self._build()
+        elif time.monotonic() - self.built_at >= SKILL_SNAPSHOT_MAX_AGE_SECONDS and self._rebuild is None:
+            self._rebuild = asyncio.create_task(self._background_rebuild())
+        return self.matrix
+
+    async def _background_rebuild(self):
+        try:
+            async with self._lock:
+                await self._build()
+        except Exception:
+            logger.exception("Rebuilding the %s skill snapshot failed; keeping the previous one", self.collection_name)
+            self.built_at = time.monotonic()  # retry after another full interval
+        finally:
+            self._rebuild = None
+
+    async def _build(self):
+        await skill_registry.load()
+        self._pending = []
+        try:
+            matrix = SkillMatrix(self.column_types)
+            projection = {"_id": 0, "id": 1, self.skills_field: 1, **{name: 1 for name in self.fields}}
+            batch = []
+            async for doc in db[self.collection_name].find({}, projection).batch_size(SKILL_SNAPSHOT_BATCH_SIZE):
+                batch.append(doc)
+                if len(batch) == SKILL_SNAPSHOT_BATCH_SIZE:
+                    self._load_batch(matrix, batch)
+                    batch = []
+            if batch:
+                self._load_batch(matrix, batch)
+            
+            # Replay writes that arrived while reading; the read may or may not have seen them
+            for kind, payload in self._pending:
+                if kind == "upsert":
+                    bits, values = self._row(payload)
+                    matrix.upsert(payload["id"], bits, **values)
+                else:
+                    matrix.remove(payload)
+            self.matrix, self.built_at = matrix, time.monotonic()
+        finally:
+            self._pending = None
+
+    def _load_batch(self, matrix: SkillMatrix, docs: List[dict]):
+        rows = [self._row(doc) for doc in docs]
+        values = {name: np.fromiter((row_values[name] for _, row_values in rows), dtype=dtype, count=len(rows))
+                  for name, dtype in self.column_types.items()}
+        matrix.upsert_many([doc["id"] for doc in docs], [bits for bits, _ in rows], values)
+
+    async def upsert(self, doc: dict):
+        # Callers look the document's skills up when computing its stored mask, so known_bits is current
+        if self._pending is not None:
+            self._pending.append(("upsert", doc))
+        if self.matrix is not None:
+            bits, values = self._row(doc)
+            self.matrix.upsert(doc["id"], bits, **values)
+
+    def remove(self, doc_id: str):
+        if self._pending is not None:
+            self._pending.append(("remove", doc_id))
+        if self.matrix is not None:
+            self.matrix.remove(doc_id)
+
+student_snapshot = SkillSnapshot(
+    "students", "completed_skills",
+    columns={"year_of_passout": np.int32},
+    fields=["year_of_passout"],
+    encode=lambda doc: {"year_of_passout": doc["year_of_passout"]}
+)
+
+def _encode_job_row(doc: dict) -> dict:
+    year_level = doc.get("year_level")
+    return {
+        "study_year": YEAR_LEVEL_STUDY_YEAR[YearLevel(year_level)] if year_level else 0,
+        "fulltime": doc.get("job_type") == JobType.FULLTIME,
+        "experienced": doc.get("experience_level") == "experienced",
+        "required_count": len({normalize_skill(skill) for skill in doc.get("required_skills", [])})
+    }
+
+job_snapshot = SkillSnapshot(
+    "jobs", "required_skills",
+    columns={"study_year": np.int8, "fulltime": bool, "experienced": bool, "required_count": np.int32},
+    fields=["year_level", "job_type", "experience_level"],
+    encode=_encode_job_row
+)
+
+def eligible_jobs(columns: dict, study_year: int) -> np.ndarray:
+    """Which job rows (job snapshot columns) are open to a student in the given year of study"""
+    in_college = 1 <= study_year <= 4
+    return np.where(
+        columns["fulltime"],
+        # Experienced roles for graduates; fresher roles for final-year students too
+        np.where(columns["experienced"], study_year == 5, study_year >= 4),
+        # Internships for the student's own year, or for any year when the job names none
+        in_college & ((columns["study_year"] == 0) | (columns["study_year"] == study_year))
+    )
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Row indices of the k highest scores, best first"""
+    k = min(k, len(scores))
+    if k == 0:
+        return np.zeros(0, dtype=np.int64)
+    candidates = np.argpartition(-scores, k - 1)[:k]
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+# Candidate ranking weights: required-skill coverage, year-of-study fit, breadth of extra skills
+MATCH_WEIGHTS = {"coverage": 0.6, "year_fit": 0.3, "extra_skills": 0.1}
+EXTRA_SKILLS_CAP = 10
+
+def candidate_scores(matrix: SkillMatrix, job: dict, required_bits: List[int], today: Optional[datetime] = None) -> tuple:
+    """(scores, year fit) for every row of a student matrix; removed or ineligible students score -inf.
+    Coverage is over the job's distinct required skills, so a required skill without a bit can't be matched."""
+    required_count = len({normalize_skill(skill) for skill in job["required_skills"]})
+    matched = matrix.overlap(matrix.vector(required_bits))
+    extra = matrix.skill_counts[:matrix.size] - matched
+    coverage = matched / required_count if required_count else np.ones(matrix.size)
+    fit = year_fit(study_years(matrix.columns["year_of_passout"][:matrix.size], today), job)
+    scores = (
+        MATCH_WEIGHTS["coverage"] * coverage
+        + MATCH_WEIGHTS["year_fit"] * fit
+        + MATCH_WEIGHTS["extra_skills"] * np.minimum(extra, EXTRA_SKILLS_CAP) / EXTRA_SKILLS_CAP
+    )
+    return np.where(matrix.active[:matrix.size] & (fit > 0), scores, -np.inf), fit
+
+# Request-scoped batching loaders
+class BatchLoader:
+    """Collects keys requested within one event-loop tick and resolves them with a single $in query"""
+    def __init__(self, collection, key: str = "id"):
+        self.collection = collection
+        self.key = key
+        self._futures = {}
+        self._pending = []
+
+    def load(self, value) -> asyncio.Future:
+        if value in self._futures:
+            return self._futures[value]
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._futures[value] = future
+        self._pending.append(value)
+        if len(self._pending) == 1:
+            loop.call_soon(lambda: asyncio.ensure_future(self._dispatch()))
+        return future
+
+    async def load_many(self, values: List) -> List[Optional[dict]]:
+        return list(await asyncio.gather(*(self.load(value) for value in values)))
+
+    async def _dispatch(self):
+        keys, self._pending = self._pending, []
+        try:
+            docs = await self.collection.find({self.key: {"$in": keys}}).to_list(None)
+        except Exception as exc:
+            for value in keys:
+                future = self._futures.pop(value)
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        docs_by_key = {doc[self.key]: doc for doc in docs}
+        for value in keys:
+            future = self._futures[value]
+            if not future.done():
+                future.set_result(docs_by_key.get(value))
+
+class Loaders:
+    def __init__(self):
+        self.users = BatchLoader(db.users)
+        self.jobs = BatchLoader(db.jobs)
+        self.students = BatchLoader(db.students, key="user_id")
+        self.recruiters = BatchLoader(db.recruiters, key="user_id")
+
+async def get_loaders() -> Loaders:
+    # FastAPI caches dependencies per request, so every handler dependency shares one set
+    return Loaders()
+
+# Authenticated principal
+async def get_principal(current_user: dict = Depends(get_current_user), loaders: Loaders = Depends(get_loaders)) -> Principal:
+    """Resolve the token to user, role, profile id and verification flag, cached across requests by user id"""
+    user_id = current_user["user_id"]
+    principal = principal_cache.get(user_id)
+    if principal is not None:
+        return principal
+    
+    profile_loaders = {"student": loaders.students, "recruiter": loaders.recruiters}
+    profile_loader = profile_loaders.get(current_user["role"])
+    if profile_loader:
+        user_doc, profile_doc = await asyncio.gather(loaders.users.load(user_id), profile_loader.load(user_id))
+    else:
+        user_doc, profile_doc = await loaders.users.load(user_id), None
+    if not user_doc:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+    
+    principal = Principal(
+        user_id=user_id,
+        role=user_doc["role"],
+        name=user_doc["name"],
+        email=user_doc["email"],
+        is_verified=user_doc.get("is_verified", False),
+        profile_id=profile_doc["id"] if profile_doc else None
+    )
+    # Only cache once onboarding is done, so another worker's cached "no profile yet" can't outlive profile creation
+    if principal.profile_id is not None or principal.role == UserRole.ADMIN:
+        principal_cache.set(user_id, principal)
+    return principal
+
 # Routes
 @api_router.get("/")
 async def root():
@@ -195,7 +1432,7 @@ async def register(user_data: UserCreate):
         raise HTTPException(status_code=400, detail="Email already registered")
     
     # Create user
-    hashed_password = hash_password(user_data.password)
+    hashed_password = await password_pool.run(hash_password, user_data.password)
     user = User(
         email=user_data.email,
         password_hash=hashed_password,
@@ -203,7 +1440,12 @@ async def register(user_data: UserCreate):
         name=user_data.name
     )
     
-    await db.users.insert_one(user.dict())
+    try:
+        await db.users.insert_one(user.dict())
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Email already registered")
+    
+    await record_activity("registration", f"New {user.role.value} registered: {user.name}")
     
     # Create JWT token
     token = create_jwt_token(user.id, user.role.value)
@@ -219,7 +1461,7 @@ async def register(user_data: UserCreate):
 async def login(login_data: LoginRequest):
     # Find user
     user_doc = await db.users.find_one({"email": login_data.email})
-    if not user_doc or not verify_password(login_data.password, user_doc["password_hash"]):
+    if not user_doc or not await password_pool.run(verify_password, login_data.password, user_doc["password_hash"]):
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
     user = User(**user_doc)
@@ -232,6 +1474,13 @@ async def login(login_data: LoginRequest):
         user_id=user.id
     )
 
+@api_router.post("/auth/logout")
+async def logout(current_user: dict = Depends(get_current_user)):
+    if current_user["token_id"]:
+        await revoked_tokens.revoke(current_user["token_id"], current_user["expires_at"])
+    principal_cache.invalidate(current_user["user_id"])
+    return {"message": "Logged out successfully"}
+
 # Student Routes
 @api_router.post("/students/profile")
 async def create_student_profile(student_data: StudentCreate, current_user: dict = Depends(get_current_user)):
@@ -248,26 +1497,36 @@ async def create_student_profile(student_data: StudentCreate, current_user: dict
         **student_data.dict()
     )
     
-    await db.students.insert_one(student.dict())
+    await db.students.insert_one({**student.dict(), "skill_mask": skill_mask([])})
+    await student_snapshot.upsert(student.dict())
+    college_index.add(student.college)
+    principal_cache.invalidate(current_user["user_id"])
     return {"message": "Student profile created successfully"}
 
 @api_router.get("/students/profile")
-async def get_student_profile(current_user: dict = Depends(get_current_user)):
-    if current_user["role"] != "student":
+async def get_student_profile(principal: Principal = Depends(get_principal), loaders: Loaders = Depends(get_loaders)):
+    if principal.role != UserRole.STUDENT:
         raise HTTPException(status_code=403, detail="Access denied")
     
-    student_doc = await db.students.find_one({"user_id": current_user["user_id"]})
-    if not student_doc:
+    profile = await _student_profile(principal, loaders)
+    if profile is None:
         raise HTTPException(status_code=404, detail="Student profile not found")
+    return profile
+
+async def _student_profile(principal: Principal, loaders: Loaders) -> Optional[dict]:
+    if principal.profile_id is None:
+        return None
+    # Shares the request's loader, so a cold principal lookup already fetched this document
+    student_doc = await loaders.students.load(principal.user_id)
+    if not student_doc:
+        return None
     
-    user_doc = await db.users.find_one({"id": current_user["user_id"]})
     student = Student(**student_doc)
-    user = User(**user_doc)
     
     return {
         "id": student.id,
-        "name": user.name,
-        "email": user.email,
+        "name": principal.name,
+        "email": principal.email,
         "college": student.college,
         "branch": student.branch,
         "year_of_passout": student.year_of_passout,
@@ -276,19 +1535,31 @@ async def get_student_profile(current_user: dict = Depends(get_current_user)):
     }
 
 @api_router.post("/students/complete-skill/{skill_name}")
-async def complete_skill(skill_name: str, current_user: dict = Depends(get_current_user)):
-    if current_user["role"] != "student":
+async def complete_skill(skill_name: str, principal: Principal = Depends(get_principal)):
+    if principal.role != UserRole.STUDENT:
         raise HTTPException(status_code=403, detail="Access denied")
+    if principal.profile_id is None:
+        raise HTTPException(status_code=404, detail="Student profile not found or skill already completed")
     
     # Update student's completed skills
-    result = await db.students.update_one(
-        {"user_id": current_user["user_id"]},
-        {"$addToSet": {"completed_skills": skill_name}}
+    student_doc = await db.students.find_one_and_update(
+        {"id": principal.profile_id, "completed_skills": {"$ne": skill_name}},
+        {"$addToSet": {"completed_skills": skill_name}},
+        projection={"_id": 0, "id": 1, "completed_skills": 1, "year_of_passout": 1},
+        return_document=ReturnDocument.AFTER
     )
     
-    if result.modified_count == 0:
+    if not student_doc:
         raise HTTPException(status_code=404, detail="Student profile not found or skill already completed")
     
+    # Only write the mask if the list is unchanged, so a concurrent completion's mask is never overwritten by a stale one
+    await db.students.update_one(
+        {"id": student_doc["id"], "completed_skills": student_doc["completed_skills"]},
+        {"$set": {"skill_mask": await skill_registry.mask(student_doc["completed_skills"])}}
+    )
+    await student_snapshot.upsert(student_doc)
+    await record_activity("skill", f"Course completed: {skill_name}")
+    
     return {"message": f"Skill '{skill_name}' completed successfully"}
 
 # Recruiter Routes
@@ -307,72 +1578,110 @@ async def create_recruiter_profile(recruiter_data: RecruiterCreate, current_user
     )
     
     await db.recruiters.insert_one(recruiter.dict())
+    principal_cache.invalidate(current_user["user_id"])
     return {"message": "Recruiter profile created successfully"}
 
 @api_router.get("/recruiters/profile")
-async def get_recruiter_profile(current_user: dict = Depends(get_current_user)):
-    if current_user["role"] != "recruiter":
+async def get_recruiter_profile(principal: Principal = Depends(get_principal), loaders: Loaders = Depends(get_loaders)):
+    if principal.role != UserRole.RECRUITER:
         raise HTTPException(status_code=403, detail="Access denied")
+    if principal.profile_id is None:
+        raise HTTPException(status_code=404, detail="Recruiter profile not found")
     
-    recruiter_doc = await db.recruiters.find_one({"user_id": current_user["user_id"]})
+    recruiter_doc = await loaders.recruiters.load(principal.user_id)
     if not recruiter_doc:
         raise HTTPException(status_code=404, detail="Recruiter profile not found")
     
-    user_doc = await db.users.find_one({"id": current_user["user_id"]})
     recruiter = Recruiter(**recruiter_doc)
-    user = User(**user_doc)
     
     return {
         "id": recruiter.id,
-        "name": user.name,
-        "email": user.email,
+        "name": principal.name,
+        "email": principal.email,
         "company": recruiter.company,
         "position": recruiter.position,
         "phone": recruiter.phone,
-        "is_verified": recruiter.is_verified
+        "is_verified": principal.is_verified
     }
 
-@api_router.post("/recruiters/search-students")
-async def search_students(search_data: StudentSearch, current_user: dict = Depends(get_current_user)):
-    if current_user["role"] != "recruiter":
-        raise HTTPException(status_code=403, detail="Access denied")
-    
-    # Build search query
+async def student_search_query(search_data: StudentSearch) -> dict:
+    """Filter on the students collection for a recruiter search"""
     query = {}
     if search_data.college:
-        query["college"] = {"$regex": search_data.college, "$options": "i"}
+        # Anchored, case-sensitive regex on the normalized key can use the college_key index
+        query["college_key"] = {"$regex": "^" + re.escape(normalize_college(search_data.college))}
     if search_data.year_of_passout:
         query["year_of_passout"] = search_data.year_of_passout
     if search_data.skills:
-        query["completed_skills"] = {"$in": search_data.skills}
-    
-    students = await db.students.find(query).to_list(100)
-    
-    # Get user details and rank by skills
-    result = []
-    for student_doc in students:
-        user_doc = await db.users.find_one({"id": student_doc["user_id"]})
-        if user_doc:
-            result.append({
-                "id": student_doc["id"],
-                "name": user_doc["name"],
-                "email": user_doc["email"],
-                "college": student_doc["college"],
-                "branch": student_doc["branch"],
-                "year_of_passout": student_doc["year_of_passout"],
-                "completed_skills": student_doc["completed_skills"],
-                "skill_count": len(student_doc["completed_skills"])
-            })
+        bits = await skill_registry.lookup(search_data.skills)
+        known_bits = [bit for bit in bits if bit is not None]
+        # Only course skills have bits; any other skill is matched on the stored skill names
+        other_skills = [skill for skill, bit in zip(search_data.skills, bits) if bit is None]
+        if search_data.skill_match == SkillMatch.ALL:
+            if known_bits:
+                query["skill_mask"] = {"$bitsAllSet": skill_mask(known_bits)}
+            if other_skills:
+                query["completed_skills"] = {"$all": other_skills}
+        else:
+            clauses = []
+            if known_bits:
+                clauses.append({"skill_mask": {"$bitsAnySet": skill_mask(known_bits)}})
+            if other_skills:
+                clauses.append({"completed_skills": {"$in": other_skills}})
+            if len(clauses) == 1:
+                query.update(clauses[0])
+            else:
+                query["$or"] = clauses
+    return query
+
+def student_search_pipeline(query: dict) -> List[dict]:
+    """Top 100 students matching the filter, ranked by skill count (more skills = higher ranking) before the cut,
+    with user details joined in the same round trip"""
+    return [
+        {"$match": query},
+        {"$addFields": {"skill_count": {"$size": "$completed_skills"}}},
+        {"$sort": {"skill_count": -1, "id": 1}},
+        {"$limit": 100},
+        {"$lookup": {"from": "users", "localField": "user_id", "foreignField": "id", "as": "user"}},
+        {"$unwind": "$user"},
+        {"$project": {
+            "_id": 0,
+            "id": 1,
+            "name": "$user.name",
+            "email": "$user.email",
+            "college": 1,
+            "branch": 1,
+            "year_of_passout": 1,
+            "completed_skills": 1,
+            "skill_count": 1
+        }}
+    ]
+
+@api_router.post("/recruiters/search-students")
+async def search_students(search_data: StudentSearch, current_user: dict = Depends(get_current_user)):
+    if current_user["role"] != "recruiter":
+        raise HTTPException(status_code=403, detail="Access denied")
     
-    # Sort by skill count (more skills = higher ranking)
-    result.sort(key=lambda x: x["skill_count"], reverse=True)
-    return result
+    pipeline = student_search_pipeline(await student_search_query(search_data))
+    return await replica_db.students.aggregate(pipeline).to_list(100)
+
+# College Routes
+@api_router.get("/colleges/autocomplete")
+async def autocomplete_colleges(
+    prefix: str = Query("", max_length=100),
+    limit: int = Query(10, ge=1, le=50),
+    current_user: dict = Depends(get_current_user)
+):
+    await college_index.ensure_fresh()
+    return college_index.complete(prefix, limit)
 
 # Course Routes
+async def _list_courses():
+    return await db.courses.find({}, COURSE_PROJECTION).to_list(100)
+
 @api_router.get("/courses")
-async def get_courses():
-    courses = await db.courses.find().to_list(100)
-    return [Course(**course) for course in courses]
+async def get_courses(if_none_match: Optional[str] = Header(None)):
+    return await response_cache.respond("courses", (), if_none_match, _list_courses)
 
 # Job Routes
 @api_router.post("/jobs")
@@ -385,11 +1694,134 @@ async def create_job(job_data: JobCreate, current_user: dict = Depends(get_curre
         **job_data.dict()
     )
     
-    await db.jobs.insert_one(job.dict())
+    await db.jobs.insert_one({**job.dict(), "required_skill_mask": await skill_registry.mask(job.required_skills)})
+    await job_snapshot.upsert(job.dict())
+    response_cache.bump("jobs")
+    await record_activity("job", f"New job posted: {job.title}")
     return {"message": "Job posted successfully", "job_id": job.id}
 
-@api_router.get("/jobs")
-async def get_jobs(job_type: Optional[JobType] = None, year_level: Optional[YearLevel] = None, experience_level: Optional[str] = None):
+async def insert_jobs(items: List[tuple], posted_by: str) -> List[dict]:
+    """Validate (index, payload) pairs and insert the valid ones with one unordered insert_many, reporting per item.
+    A None payload marks an item that failed to parse."""
+    results = []
+    jobs = []
+    for index, payload in items:
+        if payload is None:
+            results.append({"index": index, "error": "Invalid JSON"})
+            continue
+        if not isinstance(payload, dict):
+            results.append({"index": index, "error": "Job payload must be an object"})
+            continue
+        try:
+            jobs.append((index, Job(posted_by=posted_by, **JobCreate(**payload).dict())))
+        except ValidationError as exc:
+            results.append({"index": index, "error": "Invalid job", "details": exc.errors(include_url=False, include_context=False, include_input=False)})
+    if not jobs:
+        return results
+    
+    await skill_registry.lookup([skill for _, job in jobs for skill in job.required_skills])
+    docs = [
+        {**job.dict(), "required_skill_mask": skill_mask(skill_registry.known_bits(job.required_skills))}
+        for _, job in jobs
+    ]
+    try:
+        await db.jobs.insert_many(docs, ordered=False)
+        write_errors = {}
+    except BulkWriteError as exc:
+        write_errors = {error["index"]: error["errmsg"] for error in exc.details["writeErrors"]}
+    
+    for position, (index, job) in enumerate(jobs):
+        if position in write_errors:
+            results.append({"index": index, "error": write_errors[position]})
+        else:
+            await job_snapshot.upsert(job.dict())
+            results.append({"index": index, "job_id": job.id})
+    return results
+
+async def _ndjson_items(request: Request):
+    """Yield (index, payload) pairs from an NDJSON request body as it streams in"""
+    buffer = b""
+    index = 0
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                try:
+                    yield index, orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    yield index, None
+                index += 1
+    if buffer.strip():
+        try:
+            yield index, orjson.loads(buffer)
+        except orjson.JSONDecodeError:
+            yield index, None
+
+@api_router.post("/jobs/bulk")
+async def create_jobs_bulk(
+    request: Request,
+    max_items: int = Query(BULK_JOBS_MAX_ITEMS, ge=1, le=BULK_JOBS_MAX_ITEMS),
+    current_user: dict = Depends(get_current_user)
+):
+    """Post many jobs from a JSON array or an application/x-ndjson stream of JobCreate payloads.
+    A JSON array longer than max_items is rejected outright; an NDJSON stream is read up to max_items
+    and the response is marked truncated, so the client can resend the rest from that index."""
+    if current_user["role"] not in ["recruiter", "admin"]:
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    if request.headers.get("content-type", "").startswith("application/x-ndjson"):
+        items = _ndjson_items(request)
+    else:
+        try:
+            payloads = orjson.loads(await request.body())
+        except orjson.JSONDecodeError:
+            raise HTTPException(status_code=400, detail="Request body must be a JSON array or NDJSON")
+        if not isinstance(payloads, list):
+            raise HTTPException(status_code=400, detail="Request body must be a JSON array or NDJSON")
+        if len(payloads) > max_items:
+            raise HTTPException(status_code=413, detail=f"At most {max_items} jobs per request")
+        
+        async def _array_items():
+            for item in enumerate(payloads):
+                yield item
+        items = _array_items()
+    
+    results = []
+    chunk = []
+    truncated = False
+    async for index, payload in items:
+        if index >= max_items:
+            # Only an NDJSON stream can get here; stop reading and leave the rest to the client
+            truncated = True
+            break
+        chunk.append((index, payload))
+        if len(chunk) == BULK_INSERT_CHUNK_SIZE:
+            results.extend(await insert_jobs(chunk, current_user["user_id"]))
+            chunk = []
+    if chunk:
+        results.extend(await insert_jobs(chunk, current_user["user_id"]))
+    
+    results.sort(key=lambda result: result["index"])
+    inserted = sum(1 for result in results if "job_id" in result)
+    if inserted:
+        response_cache.bump("jobs")
+        await record_activity("job", f"{inserted} jobs posted in bulk")
+    
+    return {
+        "inserted": inserted,
+        "failed": len(results) - inserted,
+        "truncated": truncated,
+        "results": results
+    }
+
+async def _list_jobs(
+    job_type: Optional[JobType],
+    year_level: Optional[YearLevel],
+    experience_level: Optional[str],
+    limit: int,
+    cursor: Optional[str]
+):
     query = {}
     if job_type:
         query["job_type"] = job_type
@@ -397,43 +1829,267 @@ async def get_jobs(job_type: Optional[JobType] = None, year_level: Optional[Year
         query["year_level"] = year_level
     if experience_level:
         query["experience_level"] = experience_level
+    if cursor:
+        query.update(keyset_filter([field for field, _ in JOBS_SORT], decode_cursor(cursor), descending=True))
+    
+    # Fetch one extra document to learn whether another page exists
+    jobs = await db.jobs.find(query, JOB_PROJECTION).sort(JOBS_SORT).limit(limit + 1).to_list(limit + 1)
+    next_cursor = None
+    if len(jobs) > limit:
+        jobs = jobs[:limit]
+        next_cursor = encode_cursor(jobs[-1]["created_at"], jobs[-1]["id"])
     
-    jobs = await db.jobs.find(query).sort("created_at", -1).to_list(100)
-    return [Job(**job) for job in jobs]
+    return {
+        "jobs": jobs,
+        "next_cursor": next_cursor
+    }
+
+@api_router.get("/jobs")
+async def get_jobs(
+    job_type: Optional[JobType] = None,
+    year_level: Optional[YearLevel] = None,
+    experience_level: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None)
+):
+    if cursor:
+        decode_cursor(cursor)  # reject malformed cursors before they reach the cache
+    key = (job_type, year_level, experience_level, limit, cursor)
+    return await response_cache.respond(
+        "jobs", key, if_none_match,
+        lambda: _list_jobs(job_type, year_level, experience_level, limit, cursor)
+    )
+
+@api_router.get("/jobs/search")
+async def search_jobs(
+    q: str = Query(..., min_length=1, max_length=200),
+    job_type: Optional[JobType] = None,
+    year_level: Optional[YearLevel] = None,
+    experience_level: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None
+):
+    query = {"$text": {"$search": q}}
+    if job_type:
+        query["job_type"] = job_type
+    if year_level:
+        query["year_level"] = year_level
+    if experience_level:
+        query["experience_level"] = experience_level
+    
+    # Candidates come from the text index; rank by relevance, then recency, and page on (score, created_at, id)
+    pipeline = [
+        {"$match": query},
+        {"$addFields": {"score": {"$meta": "textScore"}}}
+    ]
+    if cursor:
+        pipeline.append({"$match": keyset_filter([field for field, _ in JOB_SEARCH_SORT], decode_cursor(cursor), descending=True)})
+    pipeline += [
+        {"$sort": dict(JOB_SEARCH_SORT)},
+        {"$limit": limit + 1},
+        {"$project": {**JOB_PROJECTION, "score": 1}}
+    ]
+    
+    jobs = await replica_db.jobs.aggregate(pipeline).to_list(limit + 1)
+    next_cursor = None
+    if len(jobs) > limit:
+        jobs = jobs[:limit]
+        next_cursor = encode_cursor(*(jobs[-1][field] for field, _ in JOB_SEARCH_SORT))
+    
+    return {
+        "jobs": jobs,
+        "next_cursor": next_cursor
+    }
+
+@api_router.get("/jobs/{job_id}/candidates")
+async def get_job_candidates(job_id: str, limit: int = Query(20, ge=1, le=100), current_user: dict = Depends(get_current_user)):
+    if current_user["role"] not in ["recruiter", "admin"]:
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    job = await db.jobs.find_one({"id": job_id}, {"_id": 0})
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    matrix = await student_snapshot.get()
+    # lookup rather than known_bits, so a skill registered by another worker since our last load is counted
+    required_bits = [bit for bit in await skill_registry.lookup(job["required_skills"]) if bit is not None]
+    
+    # Score every student in one pass over the packed skill matrix
+    scores, fit = candidate_scores(matrix, job, required_bits)
+    rows = [row for row in top_k(scores, limit) if np.isfinite(scores[row])]
+    if not rows:
+        return []
+    
+    student_ids = [matrix.ids[row] for row in rows]
+    docs = await replica_db.students.aggregate([
+        {"$match": {"id": {"$in": student_ids}}},
+        {"$lookup": {"from": "users", "localField": "user_id", "foreignField": "id", "as": "user"}},
+        {"$unwind": "$user"}
+    ]).to_list(None)
+    docs_by_id = {doc["id"]: doc for doc in docs}
+    
+    required_keys = {normalize_skill(skill) for skill in job["required_skills"]}
+    result = []
+    for row, student_id in zip(rows, student_ids):
+        doc = docs_by_id.get(student_id)
+        if not doc:
+            continue
+        skill_keys = {normalize_skill(skill) for skill in doc["completed_skills"]}
+        result.append({
+            "id": doc["id"],
+            "name": doc["user"]["name"],
+            "email": doc["user"]["email"],
+            "college": doc["college"],
+            "branch": doc["branch"],
+            "year_of_passout": doc["year_of_passout"],
+            "completed_skills": doc["completed_skills"],
+            "matched_skills": [skill for skill in job["required_skills"] if normalize_skill(skill) in skill_keys],
+            "missing_skills": [skill for skill in job["required_skills"] if normalize_skill(skill) not in skill_keys],
+            "extra_skill_count": len(skill_keys - required_keys),
+            "year_fit": float(fit[row]),
+            "score": round(float(scores[row]), 4)
+        })
+    
+    return result
 
 @api_router.post("/jobs/{job_id}/apply")
-async def apply_to_job(job_id: str, current_user: dict = Depends(get_current_user)):
+async def apply_to_job(job_id: str, idempotency_key: Optional[str] = Header(None), current_user: dict = Depends(get_current_user)):
     if current_user["role"] != "student":
         raise HTTPException(status_code=403, detail="Only students can apply to jobs")
     
     # Check if job exists
-    job = await db.jobs.find_one({"id": job_id})
+    job = await db.jobs.find_one({"id": job_id}, {"_id": 0, "title": 1, "company": 1})
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    # Check if already applied
-    existing_application = await db.applications.find_one({"student_id": current_user["user_id"], "job_id": job_id})
-    if existing_application:
-        raise HTTPException(status_code=400, detail="Already applied to this job")
-    
     application = Application(
         student_id=current_user["user_id"],
         job_id=job_id
     )
     
-    await db.applications.insert_one(application.dict())
+    # Apply in a single upsert; the unique (student_id, job_id) index turns concurrent duplicates into errors
+    application_filter = {"student_id": application.student_id, "job_id": application.job_id}
+    new_fields = {key: value for key, value in application.dict().items() if key not in application_filter}
+    try:
+        existing_application = await db.applications.find_one_and_update(
+            application_filter,
+            {"$setOnInsert": {**new_fields, "idempotency_key": idempotency_key}},
+            upsert=True,
+            projection={"_id": 0, "idempotency_key": 1},
+            return_document=ReturnDocument.BEFORE
+        )
+    except DuplicateKeyError:
+        if not idempotency_key:
+            raise HTTPException(status_code=400, detail="Already applied to this job")
+        existing_application = await db.applications.find_one(application_filter, {"_id": 0, "idempotency_key": 1})
+    
+    if existing_application is not None:
+        # A client retry carrying the original key gets the original success response
+        if idempotency_key and existing_application.get("idempotency_key") == idempotency_key:
+            return {"message": "Application submitted successfully"}
+        raise HTTPException(status_code=400, detail="Already applied to this job")
+    
+    await record_activity("application", f"New application: {job['title']} at {job['company']}")
     return {"message": "Application submitted successfully"}
 
+# Recruiter Applicant Pipeline
+async def _get_managed_job(job_id: str, current_user: dict) -> dict:
+    """The job, if the current user is its recruiter or an admin"""
+    if current_user["role"] not in ["recruiter", "admin"]:
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    job = await db.jobs.find_one({"id": job_id}, {"_id": 0, "id": 1, "posted_by": 1})
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if current_user["role"] == "recruiter" and job["posted_by"] != current_user["user_id"]:
+        raise HTTPException(status_code=403, detail="Access denied")
+    return job
+
+@api_router.get("/jobs/{job_id}/applications")
+async def get_job_applications(
+    job_id: str,
+    status_filter: Optional[ApplicationStatus] = Query(None, alias="status"),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    await _get_managed_job(job_id, current_user)
+    
+    query = {"job_id": job_id}
+    if status_filter:
+        query["status"] = status_filter
+    if cursor:
+        query.update(keyset_filter([field for field, _ in APPLICANTS_SORT], decode_cursor(cursor), descending=True))
+    
+    # One indexed page of applications, joined to student and user details in the same round trip
+    pipeline = [
+        {"$match": query},
+        {"$sort": dict(APPLICANTS_SORT)},
+        {"$limit": limit + 1},
+        {"$lookup": {"from": "students", "localField": "student_id", "foreignField": "user_id", "as": "student"}},
+        {"$lookup": {"from": "users", "localField": "student_id", "foreignField": "id", "as": "user"}},
+        {"$unwind": {"path": "$student", "preserveNullAndEmptyArrays": True}},
+        {"$unwind": "$user"},
+        {"$project": {
+            "_id": 0,
+            "application_id": "$id",
+            "status": 1,
+            "applied_at": 1,
+            "status_history": 1,
+            "student_id": "$student.id",
+            "name": "$user.name",
+            "email": "$user.email",
+            "college": "$student.college",
+            "branch": "$student.branch",
+            "year_of_passout": "$student.year_of_passout",
+            "completed_skills": "$student.completed_skills"
+        }}
+    ]
+    applications = await db.applications.aggregate(pipeline).to_list(limit + 1)
+    next_cursor = None
+    if len(applications) > limit:
+        applications = applications[:limit]
+        next_cursor = encode_cursor(applications[-1]["applied_at"], applications[-1]["application_id"])
+    
+    return {
+        "applications": applications,
+        "next_cursor": next_cursor
+    }
+
+@api_router.post("/jobs/{job_id}/applications/status")
+async def update_application_status(job_id: str, update: ApplicationStatusUpdate, current_user: dict = Depends(get_current_user)):
+    await _get_managed_job(job_id, current_user)
+    
+    result = await db.applications.update_many(
+        {"job_id": job_id, "id": {"$in": update.application_ids}, "status": {"$ne": update.status}},
+        {
+            "$set": {"status": update.status},
+            "$push": {"status_history": {
+                "$each": [{"status": update.status, "changed_at": datetime.now(timezone.utc), "changed_by": current_user["user_id"]}],
+                "$slice": -STATUS_HISTORY_LIMIT
+            }}
+        }
+    )
+    
+    return {
+        "message": "Application status updated successfully",
+        "updated": result.modified_count
+    }
+
 @api_router.get("/students/applications")
-async def get_student_applications(current_user: dict = Depends(get_current_user)):
+async def get_student_applications(current_user: dict = Depends(get_current_user), loaders: Loaders = Depends(get_loaders)):
     if current_user["role"] != "student":
         raise HTTPException(status_code=403, detail="Access denied")
     
-    applications = await db.applications.find({"student_id": current_user["user_id"]}).to_list(100)
+    return await _student_applications(current_user["user_id"], loaders)
+
+async def _student_applications(user_id: str, loaders: Loaders) -> List[dict]:
+    applications = await db.applications.find({"student_id": user_id}).to_list(None)
+    jobs = await loaders.jobs.load_many([app["job_id"] for app in applications])
     
     result = []
-    for app in applications:
-        job = await db.jobs.find_one({"id": app["job_id"]})
+    for app, job in zip(applications, jobs):
         if job:
             result.append({
                 "application_id": app["id"],
@@ -446,6 +2102,86 @@ async def get_student_applications(current_user: dict = Depends(get_current_user
     
     return result
 
+@api_router.get("/students/recommended-jobs")
+async def get_recommended_jobs(
+    limit: int = Query(20, ge=1, le=100),
+    principal: Principal = Depends(get_principal),
+    loaders: Loaders = Depends(get_loaders)
+):
+    if principal.role != UserRole.STUDENT:
+        raise HTTPException(status_code=403, detail="Access denied")
+    if principal.profile_id is None:
+        raise HTTPException(status_code=404, detail="Student profile not found")
+    
+    student_doc = await loaders.students.load(principal.user_id)
+    if not student_doc:
+        raise HTTPException(status_code=404, detail="Student profile not found")
+    
+    matrix = await job_snapshot.get()
+    columns = {name: column[:matrix.size] for name, column in matrix.columns.items()}
+    
+    # Only jobs open to the student's current year of study
+    eligible = eligible_jobs(columns, int(study_years(student_doc["year_of_passout"])))
+    
+    # Coverage of each job's required skills by the student's completed skills
+    student_bits = [bit for bit in await skill_registry.lookup(student_doc["completed_skills"]) if bit is not None]
+    matched = matrix.overlap(matrix.vector(student_bits))
+    coverage = np.divide(matched, columns["required_count"], out=np.zeros(matrix.size), where=columns["required_count"] > 0)
+    scores = np.where(matrix.active[:matrix.size] & eligible, coverage, -np.inf)
+    rows = [row for row in top_k(scores, limit) if np.isfinite(scores[row])]
+    if not rows:
+        return []
+    
+    jobs = await loaders.jobs.load_many([matrix.ids[row] for row in rows])
+    skill_keys = {normalize_skill(skill) for skill in student_doc["completed_skills"]}
+    result = []
+    for row, job_doc in zip(rows, jobs):
+        if not job_doc:
+            continue
+        result.append({
+            **Job(**job_doc).dict(),
+            "match_score": round(float(scores[row]), 4),
+            "matched_skills": [skill for skill in job_doc["required_skills"] if normalize_skill(skill) in skill_keys],
+            "missing_skills": [skill for skill in job_doc["required_skills"] if normalize_skill(skill) not in skill_keys]
+        })
+    
+    return result
+
+@api_router.get("/students/dashboard")
+async def get_student_dashboard(
+    if_none_match: Optional[str] = Header(None),
+    principal: Principal = Depends(get_principal),
+    loaders: Loaders = Depends(get_loaders)
+):
+    if principal.role != UserRole.STUDENT:
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    async def profile():
+        return serialize_with_etag(await _student_profile(principal, loaders))
+    
+    async def applications():
+        return serialize_with_etag(await _student_applications(principal.user_id, loaders))
+    
+    # All four sections at once over one principal lookup and one set of loaders; courses and the
+    # first page of jobs come from the same cache entries as GET /courses and GET /jobs
+    sections = dict(zip(
+        ["profile", "courses", "jobs", "applications"],
+        await asyncio.gather(
+            profile(),
+            response_cache.entry("courses", (), _list_courses),
+            response_cache.entry("jobs", (None, None, None, 100, None), lambda: _list_jobs(None, None, None, 100, None)),
+            applications()
+        )
+    ))
+    
+    # Sections whose ETag the client sends back in If-None-Match are returned without their data
+    known_etags = {tag.strip() for tag in if_none_match.split(",")} if if_none_match else set()
+    return Response(
+        content=splice_sections(sections, known_etags),
+        media_type="application/json",
+        headers={"Cache-Control": "no-cache"}
+    )
+
 # Initialize default data
 @api_router.post("/admin/init-data")
 async def initialize_default_data(current_user: dict = Depends(get_current_user)):
@@ -461,11 +2197,15 @@ async def initialize_default_data(current_user: dict = Depends(get_current_user)
         {"title": "Communication Skills", "description": "Enhance your professional communication abilities", "skill_name": "Communication"}
     ]
     
+    registered = []
     for course_data in default_courses:
         existing = await db.courses.find_one({"skill_name": course_data["skill_name"]})
         if not existing:
             course = Course(**course_data)
+            registered += await skill_registry.ensure([course.skill_name])
             await db.courses.insert_one(course.dict())
+    if registered:
+        run_in_background(refresh_skill_masks(registered))
     
     # Add some default jobs if none exist
     job_count = await db.jobs.count_documents({})
@@ -497,8 +2237,10 @@ async def initialize_default_data(current_user: dict = Depends(get_current_user)
         
         for job_data in default_jobs:
             job = Job(**job_data)
-            await db.jobs.insert_one(job.dict())
+            await db.jobs.insert_one({**job.dict(), "required_skill_mask": await skill_registry.mask(job.required_skills)})
+            await job_snapshot.upsert(job.dict())
     
+    response_cache.bump("courses", "jobs")
     return {"message": "Default data initialized successfully"}
 
 # Admin Course Management
@@ -508,7 +2250,11 @@ async def add_course(course_data: dict, current_user: dict = Depends(get_current
         raise HTTPException(status_code=403, detail="Admin access required")
     
     course = Course(**course_data)
+    registered = await skill_registry.ensure([course.skill_name])
     await db.courses.insert_one(course.dict())
+    if registered:
+        run_in_background(refresh_skill_masks(registered))
+    response_cache.bump("courses")
     return {"message": "Course added successfully", "course_id": course.id}
 
 @api_router.put("/admin/courses/{course_id}")
@@ -516,6 +2262,11 @@ async def update_course(course_id: str, course_data: dict, current_user: dict =
     if current_user["role"] != "admin":
         raise HTTPException(status_code=403, detail="Admin access required")
     
+    if course_data.get("skill_name"):
+        registered = await skill_registry.ensure([course_data["skill_name"]])
+        if registered:
+            run_in_background(refresh_skill_masks(registered))
+    
     result = await db.courses.update_one(
         {"id": course_id},
         {"$set": course_data}
@@ -524,6 +2275,7 @@ async def update_course(course_id: str, course_data: dict, current_user: dict =
     if result.modified_count == 0:
         raise HTTPException(status_code=404, detail="Course not found")
     
+    response_cache.bump("courses")
     return {"message": "Course updated successfully"}
 
 @api_router.delete("/admin/courses/{course_id}")
@@ -536,6 +2288,7 @@ async def delete_course(course_id: str, current_user: dict = Depends(get_current
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Course not found")
     
+    response_cache.bump("courses")
     return {"message": "Course deleted successfully"}
 
 # Admin Job Management
@@ -549,17 +2302,24 @@ async def delete_job(job_id: str, current_user: dict = Depends(get_current_user)
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Job not found")
     
+    job_snapshot.remove(job_id)
+    response_cache.bump("jobs")
     return {"message": "Job deleted successfully"}
 
 # Admin User Management
-@api_router.get("/admin/users")
-async def get_all_users(current_user: dict = Depends(get_current_user)):
-    if current_user["role"] != "admin":
-        raise HTTPException(status_code=403, detail="Admin access required")
+ADMIN_USERS_SORT = [("created_at", 1), ("id", 1)]
+
+async def _admin_users_page(limit: int, after: Optional[list] = None):
+    """One page of users ordered by (created_at, id), hash-joined to their student/recruiter profiles"""
+    query = keyset_filter([field for field, _ in ADMIN_USERS_SORT], after) if after else {}
+    users = await replica_db.users.find(query, {"_id": 0, "password_hash": 0}).sort(ADMIN_USERS_SORT).limit(limit).to_list(limit)
     
-    users = await db.users.find().to_list(1000)
-    students = await db.students.find().to_list(1000)
-    recruiters = await db.recruiters.find().to_list(1000)
+    user_ids = [user["id"] for user in users]
+    students, recruiters = await asyncio.gather(
+        replica_db.students.find({"user_id": {"$in": user_ids}}).to_list(None),
+        replica_db.recruiters.find({"user_id": {"$in": user_ids}}).to_list(None)
+    )
+    users_by_id = {user["id"]: user for user in users}
     
     result = {
         "users": [],
@@ -578,31 +2338,61 @@ async def get_all_users(current_user: dict = Depends(get_current_user)):
         })
     
     for student in students:
-        user_data = next((u for u in users if u["id"] == student["user_id"]), None)
-        if user_data:
-            result["students"].append({
-                "id": student["id"],
-                "name": user_data["name"],
-                "email": user_data["email"],
-                "college": student["college"],
-                "branch": student["branch"],
-                "year_of_passout": student["year_of_passout"],
-                "completed_skills": student["completed_skills"],
-                "skill_count": len(student["completed_skills"])
-            })
+        user_data = users_by_id[student["user_id"]]
+        result["students"].append({
+            "id": student["id"],
+            "name": user_data["name"],
+            "email": user_data["email"],
+            "college": student["college"],
+            "branch": student["branch"],
+            "year_of_passout": student["year_of_passout"],
+            "completed_skills": student["completed_skills"],
+            "skill_count": len(student["completed_skills"])
+        })
     
     for recruiter in recruiters:
-        user_data = next((u for u in users if u["id"] == recruiter["user_id"]), None)
-        if user_data:
-            result["recruiters"].append({
-                "id": recruiter["id"],
-                "name": user_data["name"],
-                "email": user_data["email"],
-                "company": recruiter["company"],
-                "position": recruiter["position"],
-                "is_verified": recruiter["is_verified"]
-            })
+        user_data = users_by_id[recruiter["user_id"]]
+        result["recruiters"].append({
+            "id": recruiter["id"],
+            "name": user_data["name"],
+            "email": user_data["email"],
+            "company": recruiter["company"],
+            "position": recruiter["position"],
+            "is_verified": recruiter["is_verified"]
+        })
+    
+    next_after = None
+    if len(users) == limit:
+        next_after = [users[-1][field] for field, _ in ADMIN_USERS_SORT]
+    return result, next_after
+
+async def _stream_admin_users(limit: int, after: Optional[list]):
+    while True:
+        page, after = await _admin_users_page(limit, after)
+        for section in ("users", "students", "recruiters"):
+            for row in page[section]:
+                yield json.dumps(jsonable_encoder({"type": section[:-1], **row})) + "\n"
+        if after is None:
+            break
+
+@api_router.get("/admin/users")
+async def get_all_users(
+    limit: int = Query(500, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    stream: bool = False,
+    current_user: dict = Depends(get_current_user)
+):
+    if current_user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    after = decode_cursor(cursor) if cursor else None
     
+    # NDJSON mode walks every page server-side so the admin panel can render progressively
+    if stream:
+        return StreamingResponse(_stream_admin_users(limit, after), media_type="application/x-ndjson")
+    
+    result, next_after = await _admin_users_page(limit, after)
+    result["next_cursor"] = encode_cursor(*next_after) if next_after else None
     return result
 
 @api_router.put("/admin/users/{user_id}/verify")
@@ -625,6 +2415,7 @@ async def verify_user(user_id: str, current_user: dict = Depends(get_current_use
     if user_result.modified_count == 0:
         raise HTTPException(status_code=404, detail="User not found")
     
+    principal_cache.invalidate(user_id)
     return {"message": "User verified successfully"}
 
 # Admin Analytics
@@ -633,33 +2424,217 @@ async def get_analytics(current_user: dict = Depends(get_current_user)):
     if current_user["role"] != "admin":
         raise HTTPException(status_code=403, detail="Admin access required")
     
-    # Get counts
-    total_users = await db.users.count_documents({})
-    total_students = await db.students.count_documents({})
-    total_recruiters = await db.recruiters.count_documents({})
-    total_courses = await db.courses.count_documents({})
-    total_jobs = await db.jobs.count_documents({})
-    total_applications = await db.applications.count_documents({})
-    
-    # Get recent activity (mock data for now)
-    recent_activity = [
-        {"type": "registration", "message": "New student registered", "timestamp": datetime.now(timezone.utc)},
-        {"type": "skill", "message": "Course completed: Python Basics", "timestamp": datetime.now(timezone.utc)},
-        {"type": "job", "message": "New job posted: Frontend Developer", "timestamp": datetime.now(timezone.utc)}
-    ]
+    analytics = analytics_cache.get("analytics")
+    if analytics is None:
+        stats, recent_activity = await asyncio.gather(
+            load_stats(),
+            replica_db.activity.find({}, {"_id": 0}).sort("$natural", -1).limit(RECENT_ACTIVITY_LIMIT).to_list(RECENT_ACTIVITY_LIMIT)
+        )
+        analytics = {
+            "stats": stats,
+            "recent_activity": recent_activity
+        }
+        analytics_cache.set("analytics", analytics)
     
+    return analytics
+
+# Admin Index Verification
+@api_router.get("/admin/indexes/verify")
+async def verify_indexes(current_user: dict = Depends(get_current_user)):
+    if current_user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    report = await verify_query_plans()
     return {
-        "stats": {
-            "total_users": total_users,
-            "total_students": total_students,
-            "total_recruiters": total_recruiters,
-            "total_courses": total_courses,
-            "total_jobs": total_jobs,
-            "total_applications": total_applications
-        },
-        "recent_activity": recent_activity
+        "ok": not any(shape["collscan"] for shape in report),
+        "shapes": report
     }
 
+@api_router.get("/admin/metrics/password-hashing")
+async def get_password_hashing_metrics(current_user: dict = Depends(get_current_user)):
+    if current_user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    return password_pool.stats()
+
+# Admin Imports
+_background_tasks = set()
+
+def run_in_background(coro):
+    # Keep a reference so the task isn't garbage collected before it finishes
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+def _csv_list(value: str) -> List[str]:
+    return [item.strip() for item in value.split(";") if item.strip()]
+
+async def _import_students_chunk(rows: List[dict]) -> tuple:
+    """Insert one chunk of student rows; returns (inserted, row errors)"""
+    errors = []
+    valid = []
+    for row in rows:
+        try:
+            user_data = UserCreate(email=row["email"], password=row["password"], name=row["name"], role=UserRole.STUDENT)
+            student_data = StudentCreate(
+                college=row["college"],
+                branch=row["branch"],
+                year_of_passout=row["year_of_passout"],
+                phone=row.get("phone") or None
+            )
+        except KeyError as exc:
+            errors.append({"row": row["_row"], "error": f"Missing column {exc}"})
+            continue
+        except ValidationError as exc:
+            errors.append({"row": row["_row"], "error": "Invalid row", "details": exc.errors(include_url=False, include_context=False, include_input=False)})
+            continue
+        valid.append((row, user_data, student_data))
+    if not valid:
+        return 0, errors
+    
+    hashes = await asyncio.gather(*(import_password_pool.run(hash_password, user_data.password) for _, user_data, _ in valid))
+    users = [
+        User(email=user_data.email, password_hash=password_hash, role=user_data.role, name=user_data.name)
+        for (_, user_data, _), password_hash in zip(valid, hashes)
+    ]
+    try:
+        await db.users.insert_many([user.dict() for user in users], ordered=False)
+        write_errors = {}
+    except BulkWriteError as exc:
+        write_errors = {error["index"]: error for error in exc.details["writeErrors"]}
+    
+    students = []
+    for position, ((row, _, student_data), user) in enumerate(zip(valid, users)):
+        if position in write_errors:
+            duplicate = write_errors[position]["code"] == 11000
+            errors.append({"row": row["_row"], "error": "Email already registered" if duplicate else write_errors[position]["errmsg"]})
+            continue
+        students.append(Student(user_id=user.id, completed_skills=_csv_list(row.get("completed_skills", "")), **student_data.dict()))
+    if not students:
+        return 0, errors
+    
+    await skill_registry.lookup([skill for student in students for skill in student.completed_skills])
+    await db.students.insert_many([
+        {**student.dict(), "skill_mask": skill_mask(skill_registry.known_bits(student.completed_skills))}
+        for student in students
+    ], ordered=False)
+    for student in students:
+        await student_snapshot.upsert(student.dict())
+        college_index.add(student.college)
+    return len(students), errors
+
+async def _import_jobs_chunk(rows: List[dict], posted_by: str) -> tuple:
+    items = []
+    for row in rows:
+        payload = {key: value for key, value in row.items() if key != "_row" and value != ""}
+        payload["required_skills"] = _csv_list(row.get("required_skills", ""))
+        items.append((row["_row"], payload))
+    results = await insert_jobs(items, posted_by)
+    errors = [{"row": result["index"], **{k: v for k, v in result.items() if k != "index"}} for result in results if "error" in result]
+    return len(results) - len(errors), errors
+
+async def run_import(import_job: ImportJob, path: str):
+    """Stream the uploaded CSV in chunks, recording progress on the import's status document"""
+    loop = asyncio.get_running_loop()
+    try:
+        await db.imports.update_one({"id": import_job.id}, {"$set": {"status": ImportStatus.RUNNING}})
+        reader = pd.read_csv(path, chunksize=IMPORT_CHUNK_SIZE, dtype=str, keep_default_na=False)
+        first_row = 2  # the header is line 1
+        inserted_total = 0
+        while True:
+            # Parsing is blocking, so keep it off the event loop
+            chunk = await loop.run_in_executor(None, next, reader, None)
+            if chunk is None:
+                break
+            chunk.columns = [column.strip().lower() for column in chunk.columns]
+            rows = chunk.to_dict("records")
+            for offset, row in enumerate(rows):
+                row["_row"] = first_row + offset
+            first_row += len(rows)
+            
+            if import_job.kind == ImportKind.STUDENTS:
+                inserted, errors = await _import_students_chunk(rows)
+            else:
+                inserted, errors = await _import_jobs_chunk(rows, import_job.created_by)
+            inserted_total += inserted
+            await db.imports.update_one({"id": import_job.id}, {
+                "$inc": {"processed": len(rows), "inserted": inserted, "failed": len(errors)},
+                "$push": {"errors": {"$each": errors, "$slice": IMPORT_MAX_ERRORS}}
+            })
+        
+        await db.imports.update_one({"id": import_job.id}, {"$set": {"status": ImportStatus.COMPLETED, "finished_at": datetime.now(timezone.utc)}})
+        if import_job.kind == ImportKind.JOBS and inserted_total:
+            response_cache.bump("jobs")
+        await record_activity("import", f"Imported {inserted_total} {import_job.kind.value} from {import_job.filename}")
+    except Exception as exc:
+        logger.exception("Import %s failed", import_job.id)
+        await db.imports.update_one({"id": import_job.id}, {"$set": {
+            "status": ImportStatus.FAILED,
+            "error": str(exc),
+            "finished_at": datetime.now(timezone.utc)
+        }})
+    finally:
+        os.unlink(path)
+
+@api_router.post("/admin/import/{kind}")
+async def start_import(kind: ImportKind, file: UploadFile = File(...), current_user: dict = Depends(get_current_user)):
+    """Start a background CSV import; poll GET /api/admin/import/{import_id} for progress"""
+    if current_user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    # Spool the upload to disk in blocks so the import outlives the request without holding the file in memory
+    with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as destination:
+        await asyncio.get_running_loop().run_in_executor(None, shutil.copyfileobj, file.file, destination)
+    
+    import_job = ImportJob(kind=kind, filename=file.filename, created_by=current_user["user_id"])
+    await db.imports.insert_one(import_job.dict())
+    run_in_background(run_import(import_job, destination.name))
+    
+    return {"message": "Import started", "import_id": import_job.id}
+
+@api_router.get("/admin/import/{import_id}")
+async def get_import_status(import_id: str, current_user: dict = Depends(get_current_user)):
+    if current_user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    import_doc = await db.imports.find_one({"id": import_id}, {"_id": 0})
+    if not import_doc:
+        raise HTTPException(status_code=404, detail="Import not found")
+    
+    return import_doc
+
+# Admin Maintenance
+@api_router.post("/admin/maintenance/backfill")
+async def backfill(current_user: dict = Depends(get_current_user)):
+    if current_user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    return {"message": "Backfill completed", "updated": await backfill_derived_fields()}
+
+# Metrics
+class PasswordPoolCollector:
+    """Reports password hashing pool stats at scrape time"""
+    def collect(self):
+        pools = {"interactive": password_pool, "import": import_password_pool}
+        in_flight = GaugeMetricFamily("joblens_password_pool_in_flight", "Password hashes queued or running", labels=["pool"])
+        completed = CounterMetricFamily("joblens_password_pool_completed", "Password hashes completed", labels=["pool"])
+        rejected = CounterMetricFamily("joblens_password_pool_rejected", "Password hashes rejected because the queue was full", labels=["pool"])
+        wait = GaugeMetricFamily("joblens_password_pool_wait_p95_seconds", "p95 queue wait over recent hashes", labels=["pool"])
+        for name, pool in pools.items():
+            stats = pool.stats()
+            in_flight.add_metric([name], stats["in_flight"])
+            completed.add_metric([name], stats["completed"])
+            rejected.add_metric([name], stats["rejected"])
+            wait.add_metric([name], stats["wait_ms_p95"] / 1000)
+        return [in_flight, completed, rejected, wait]
+
+metrics_registry.register(PasswordPoolCollector())
+
+@api_router.get("/metrics")
+async def metrics():
+    # Per-process figures; with several workers, scrape each one
+    return Response(content=generate_latest(metrics_registry), media_type=CONTENT_TYPE_LATEST)
+
 # Include the router in the main app
 app.include_router(api_router)
 
@@ -671,6 +2646,30 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    method = request.method
+    durations = []
+    token = request_mongo_durations.set(durations)
+    http_requests_in_progress.labels(method).inc()
+    started_at = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        elapsed = time.perf_counter() - started_at
+        http_requests_in_progress.labels(method).dec()
+        request_mongo_durations.reset(token)
+        # Label by route template so path parameters don't explode the series count
+        route = request.scope.get("route")
+        route_path = route.path if route is not None else "unmatched"
+        http_requests_total.labels(method, route_path, str(status_code)).inc()
+        http_request_duration.labels(method, route_path).observe(elapsed)
+        mongo_commands_per_request.labels(route_path).observe(len(durations))
+        mongo_seconds_per_request.labels(route_path).observe(sum(durations))
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -678,6 +2677,39 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def startup_ensure_indexes():
+    await warm_up_mongo_pool()
+    await ensure_indexes()
+    await ensure_activity_collection()
+    await skill_registry.load()
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
-    client.close()
\ No newline at end of file
+    client.close()
+    password_pool.shutdown()
+    import_password_pool.shutdown()
+
+async def _run_command(command: str) -> int:
+    if command == "ensure-indexes":
+        await ensure_indexes()
+        return 0
+    if command == "backfill":
+        print(await backfill_derived_fields())
+        return 0
+    
+    await ensure_indexes()
+    report = await verify_query_plans()
+    for shape in report:
+        marker = "COLLSCAN" if shape["collscan"] else "ok"
+        print(f"{marker:<8} {shape['collection']:<14} {shape['name']:<36} {', '.join(shape['stages'])}")
+    return 1 if any(shape["collscan"] for shape in report) else 0
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+    
+    parser = argparse.ArgumentParser(description="JobLens maintenance commands")
+    parser.add_argument("command", choices=["ensure-indexes", "verify-indexes", "backfill"])
+    args = parser.parse_args()
+    sys.exit(asyncio.run(_run_command(args.command)))
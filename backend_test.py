@@ -410,8 +410,8 @@ class JobLensAPITester:
             
             if response.status_code == 200:
                 data = response.json()
-                if isinstance(data, list) and len(data) > 0:
-                    self.log_test("Job Listing", True, f"Successfully retrieved {len(data)} jobs")
+                if isinstance(data.get('jobs'), list) and len(data['jobs']) > 0:
+                    self.log_test("Job Listing", True, f"Successfully retrieved {len(data['jobs'])} jobs")
                 else:
                     self.log_test("Job Listing", False, "No jobs found")
             else:
@@ -433,7 +433,7 @@ class JobLensAPITester:
             try:
                 response = self.make_request('GET', '/jobs')
                 if response.status_code == 200:
-                    jobs = response.json()
+                    jobs = response.json()['jobs']
                     if jobs:
                         job_id = jobs[0]['id']
                     else:
@@ -632,7 +632,7 @@ class JobLensAPITester:
         try:
             response = self.make_request('GET', '/jobs')
             if response.status_code == 200:
-                jobs = response.json()
+                jobs = response.json()['jobs']
                 if jobs:
                     job_id = jobs[0]['id']
             
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+JobLens list serialization benchmark
+Compares the old validate-then-encode path for /api/jobs and /api/courses (Model(**doc) per document,
+jsonable_encoder, json.dumps) against the lean path (projected documents encoded directly with orjson).
+
+Usage: python benchmarks/bench_list_serialization.py --items 1000
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "joblens_bench")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from server import Course, Job, COURSE_PROJECTION, JOB_PROJECTION  # noqa: E402
+
+
+def make_documents(items: int):
+    """Documents shaped like Motor returns them: naive UTC datetimes, enums stored as strings"""
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    jobs = [
+        Job(
+            title=f"Software Engineer {i}",
+            company=f"Company {i % 50}",
+            location="Bangalore, India",
+            description="Build and ship features across the stack " * 4,
+            job_type="internship" if i % 2 else "fulltime",
+            required_skills=["Python", "SQL", "Communication"][: 1 + i % 3],
+            year_level="3rd" if i % 2 else None,
+            experience_level=None if i % 2 else "fresher",
+            salary="₹6-8 LPA",
+            posted_by="recruiter",
+            created_at=now - timedelta(minutes=i)
+        ).model_dump(mode="json") for i in range(items)
+    ]
+    courses = [
+        Course(title=f"Course {i}", description="Learn a skill", skill_name=f"Skill {i}").model_dump(mode="json")
+        for i in range(items)
+    ]
+    for doc in jobs + courses:
+        created_at = datetime.fromisoformat(doc["created_at"])
+        doc["created_at"] = created_at.replace(microsecond=created_at.microsecond // 1000 * 1000, tzinfo=None)
+    return jobs, courses
+
+
+def project(docs, projection):
+    fields = [field for field, include in projection.items() if include]
+    return [{field: doc[field] for field in fields if field in doc} for doc in docs]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    jobs, courses = make_documents(args.items)
+    cases = {
+        "jobs": (Job, jobs, project(jobs, JOB_PROJECTION)),
+        "courses": (Course, courses, project(courses, COURSE_PROJECTION))
+    }
+
+    for name, (model, docs, projected) in cases.items():
+        def validated():
+            return json.dumps(jsonable_encoder([model(**doc) for doc in docs])).encode("utf-8")
+
+        def lean():
+            return orjson.dumps(projected)
+
+        assert json.loads(validated()) == json.loads(lean()), f"{name}: outputs differ"
+        old_ms = min(timeit.repeat(validated, number=1, repeat=args.repeat)) * 1000
+        new_ms = min(timeit.repeat(lean, number=1, repeat=args.repeat)) * 1000
+        print(f"{name:<8} items={args.items:<6} validated={old_ms:.2f}ms lean={new_ms:.2f}ms speedup={old_ms / new_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+JobLens recruiter search benchmark
+Compares the old per-student find_one join on skill names against the skill-mask query and aggregation
+pipeline that /api/recruiters/search-students builds, reporting Mongo round trips and latency percentiles.
+Before timing, checks that both return the same students in skill-count order.
+
+Usage: MONGO_URL=mongodb://localhost:27017 python benchmarks/bench_search_students.py --students 10000 100000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
+
+# Course skills get bits; free-text skills are matched on the stored names
+COURSE_SKILLS = ["Resume Building", "Aptitude", "Python", "SQL", "Communication", "Java"]
+SKILLS = COURSE_SKILLS + ["React", "Rust"]
+COLLEGES = ["IIT Delhi", "NIT Trichy", "BITS Pilani", "VIT Vellore", "Anna University"]
+
+
+class CommandCounter(monitoring.CommandListener):
+    """Count commands sent to the server"""
+    def __init__(self):
+        self.count = 0
+
+    def started(self, event):
+        self.count += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+# (skills, skill_match) pairs to search for, covering course skills alone and mixed with a free-text one
+SEARCHES = [
+    (["Python", "SQL"], "any"),
+    (["Python", "SQL"], "all"),
+    (["Python", "Rust"], "any"),
+    (["Python", "Rust"], "all"),
+]
+
+
+async def seed(db, server, total_students: int):
+    await db.users.drop()
+    await db.students.drop()
+    await db.users.create_index("id", unique=True)
+    bits = dict(zip(COURSE_SKILLS, await server.skill_registry.lookup(COURSE_SKILLS)))
+    rng = random.Random(42)
+    batch_users, batch_students = [], []
+    for i in range(total_students):
+        user_id = str(uuid.UUID(int=rng.getrandbits(128)))
+        batch_users.append({"id": user_id, "name": f"Student {i}", "email": f"student{i}@bench.test", "role": "student"})
+        completed = rng.sample(SKILLS, rng.randint(0, len(SKILLS)))
+        batch_students.append({
+            "id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "user_id": user_id,
+            "college": rng.choice(COLLEGES),
+            "branch": "CSE",
+            "year_of_passout": rng.randint(2024, 2028),
+            "completed_skills": completed,
+            "skill_mask": server.skill_mask([bits[skill] for skill in completed if skill in bits])
+        })
+        if len(batch_users) == 5000:
+            await db.users.insert_many(batch_users)
+            await db.students.insert_many(batch_students)
+            batch_users, batch_students = [], []
+    if batch_users:
+        await db.users.insert_many(batch_users)
+        await db.students.insert_many(batch_students)
+
+
+def name_query(skills, skill_match: str) -> dict:
+    """The old filter on stored skill names"""
+    return {"completed_skills": {"$all" if skill_match == "all" else "$in": skills}}
+
+
+async def search_n_plus_one(db, query: dict):
+    """The pre-aggregation implementation"""
+    students = await db.students.find(query).to_list(100)
+    result = []
+    for student_doc in students:
+        user_doc = await db.users.find_one({"id": student_doc["user_id"]})
+        if user_doc:
+            result.append({
+                "id": student_doc["id"],
+                "name": user_doc["name"],
+                "skill_count": len(student_doc["completed_skills"])
+            })
+    result.sort(key=lambda x: x["skill_count"], reverse=True)
+    return result
+
+
+async def search_reference(db, query: dict):
+    """Every student matching the old filter, ranked by skill count in Python and cut to the top 100.
+    The old implementation cut before ranking, so its own output is not comparable once over 100 match."""
+    names = {doc["id"]: doc["name"] async for doc in db.users.find({}, {"_id": 0, "id": 1, "name": 1})}
+    result = [
+        {"id": doc["id"], "name": names[doc["user_id"]], "skill_count": len(doc["completed_skills"])}
+        async for doc in db.students.find(query, {"_id": 0, "id": 1, "user_id": 1, "completed_skills": 1})
+        if doc["user_id"] in names
+    ]
+    result.sort(key=lambda x: (-x["skill_count"], x["id"]))
+    return result[:100]
+
+
+async def search_pipeline(db, pipeline: list):
+    return await db.students.aggregate(pipeline).to_list(100)
+
+
+async def check_same_results(db, server, skills, skill_match: str):
+    """Exit with an error if the server's search disagrees with the old name-based filter, else return its pipeline"""
+    pipeline = server.student_search_pipeline(
+        await server.student_search_query(server.StudentSearch(skills=skills, skill_match=skill_match))
+    )
+    expected = await search_reference(db, name_query(skills, skill_match))
+    actual = [
+        {"id": doc["id"], "name": doc["name"], "skill_count": doc["skill_count"]}
+        for doc in await search_pipeline(db, pipeline)
+    ]
+    if actual != expected:
+        mismatch = next((i for i, (a, b) in enumerate(zip(actual, expected)) if a != b), min(len(actual), len(expected)))
+        raise SystemExit(
+            f"Results differ for {skill_match} of {skills}: {len(actual)} vs {len(expected)} rows, "
+            f"first difference at position {mismatch}"
+        )
+    return pipeline
+
+
+async def measure(counter: CommandCounter, search, iterations: int):
+    latencies = []
+    commands = 0
+    for _ in range(iterations):
+        before = counter.count
+        started = time.perf_counter()
+        await search()
+        latencies.append((time.perf_counter() - started) * 1000)
+        commands += counter.count - before
+    latencies.sort()
+    return {
+        "round_trips": commands / iterations,
+        "p50_ms": round(statistics.median(latencies), 2),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1], 2)
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--students", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--db-name", default="joblens_bench")
+    args = parser.parse_args()
+
+    # The search query is built by the server, whose skill registry reads the same database
+    os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+    os.environ["DB_NAME"] = args.db_name
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+    import server  # noqa: E402
+
+    counter = CommandCounter()
+    client = AsyncIOMotorClient(os.environ["MONGO_URL"], event_listeners=[counter])
+    db = client[args.db_name]
+    await client.drop_database(args.db_name)
+    await server.skill_registry.ensure(COURSE_SKILLS)
+
+    for total in args.students:
+        print(f"Seeding {total} students...")
+        await seed(db, server, total)
+        for skills, skill_match in SEARCHES:
+            pipeline = await check_same_results(db, server, skills, skill_match)
+            query = name_query(skills, skill_match)
+            print(f"  {skill_match} of {skills}: results match")
+            for name, search in [
+                ("n_plus_one", lambda: search_n_plus_one(db, query)),
+                ("pipeline", lambda: search_pipeline(db, pipeline)),
+            ]:
+                stats = await measure(counter, search, args.iterations)
+                print(f"    {name:<12} students={total:<8} round_trips={stats['round_trips']:<6} "
+                      f"p50={stats['p50_ms']}ms p95={stats['p95_ms']}ms")
+
+    await client.drop_database(args.db_name)
+    client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
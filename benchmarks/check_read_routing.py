@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+JobLens read routing check
+Runs the API in-process against a replica set and records which member served each read, verifying that search
+and dashboard reads go to a secondary while read-your-writes paths stay on the primary.
+
+Start a local three-node replica set first, e.g.:
+    mkdir -p /tmp/rs/0 /tmp/rs/1 /tmp/rs/2
+    for i in 0 1 2; do mongod --replSet rs0 --port 2701$i --dbpath /tmp/rs/$i --bind_ip localhost --fork --logpath /tmp/rs/$i.log; done
+    mongosh --port 27010 --eval 'rs.initiate({_id: "rs0", members: [
+        {_id: 0, host: "localhost:27010"}, {_id: 1, host: "localhost:27011"}, {_id: 2, host: "localhost:27012"}]})'
+
+The --db database (default joblens_routing) is dropped before each run.
+
+Usage: python benchmarks/check_read_routing.py [--url mongodb://localhost:27010,localhost:27011,localhost:27012/?replicaSet=rs0]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import uuid
+from pathlib import Path
+
+import httpx
+from pymongo import monitoring
+
+READ_COMMANDS = {"find", "aggregate", "count", "distinct"}
+
+
+class ReadRecorder(monitoring.CommandListener):
+    """Remembers the member address that served each read command"""
+    def __init__(self):
+        self.reads = []
+
+    def started(self, event):
+        if event.command_name in READ_COMMANDS:
+            self.reads.append((event.command_name, event.command[event.command_name], event.connection_id))
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+# (method, path template, command, collection, expected member)
+EXPECTATIONS = [
+    ("POST", "/recruiters/search-students", "aggregate", "students", "secondary"),
+    ("GET", "/jobs/search", "aggregate", "jobs", "secondary"),
+    ("GET", "/admin/users", "find", "users", "secondary"),
+    ("GET", "/admin/analytics", "find", "activity", "secondary"),
+    ("GET", "/admin/analytics", "count", "users", "secondary"),
+    ("GET", "/students/profile", "find", "students", "primary"),
+    ("GET", "/students/applications", "find", "applications", "primary"),
+    ("GET", "/jobs/{job_id}/applications", "aggregate", "applications", "primary")
+]
+
+
+async def main_async() -> int:
+    recorder = ReadRecorder()
+    # Global listeners apply to clients created afterwards, including the server's
+    monitoring.register(recorder)
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+    import server  # noqa: E402
+
+    # Start from an empty database: state left by an earlier run, such as the persisted analytics stats
+    # document, would let reads be answered without the commands this check looks for
+    await server.client.drop_database(server.mongo_settings.db_name)
+    await server.app.router.startup()
+    try:
+        deadline = time.monotonic() + 30
+        while not server.client.secondaries:
+            if time.monotonic() > deadline:
+                print("no secondaries discovered; is MONGO_URL a replica set?", file=sys.stderr)
+                return 2
+            await asyncio.sleep(0.5)
+        primary = server.client.primary
+        secondaries = server.client.secondaries
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=server.app), base_url="http://joblens/api") as http:
+            run_id = uuid.uuid4().hex[:8]
+
+            async def register(role):
+                response = await http.post("/auth/register", json={
+                    "email": f"{role}-{run_id}@routing.test", "password": "Routing#2024", "name": role, "role": role
+                })
+                response.raise_for_status()
+                return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+            admin, student, recruiter = await register("admin"), await register("student"), await register("recruiter")
+            (await http.post("/students/profile", headers=student, json={"college": "IIT Delhi", "branch": "CSE", "year_of_passout": 2027})).raise_for_status()
+            (await http.post("/recruiters/profile", headers=recruiter, json={"company": "Routing Co", "position": "Lead"})).raise_for_status()
+            response = await http.post("/jobs", headers=recruiter, json={
+                "title": f"Routing Engineer {run_id}", "company": "Routing Co", "location": "Remote",
+                "description": "Check read routing", "job_type": "fulltime", "required_skills": ["Python"]
+            })
+            response.raise_for_status()
+            job_id = response.json()["job_id"]
+
+            # Read-your-writes: the application must be visible immediately after it is created
+            (await http.post(f"/jobs/{job_id}/apply", headers=student)).raise_for_status()
+            applications = (await http.get("/students/applications", headers=student)).json()
+            ok = any(app["job_title"] == f"Routing Engineer {run_id}" for app in applications)
+            print(f"{'ok' if ok else 'FAIL':<6} application visible right after apply")
+
+            calls = {
+                "/recruiters/search-students": lambda: http.post("/recruiters/search-students", headers=recruiter, json={"college": "IIT"}),
+                "/jobs/search": lambda: http.get("/jobs/search", params={"q": "routing"}),
+                "/admin/users": lambda: http.get("/admin/users", headers=admin),
+                "/admin/analytics": lambda: http.get("/admin/analytics", headers=admin),
+                "/students/profile": lambda: http.get("/students/profile", headers=student),
+                "/students/applications": lambda: http.get("/students/applications", headers=student),
+                "/jobs/{job_id}/applications": lambda: http.get(f"/jobs/{job_id}/applications", headers=recruiter)
+            }
+            reads_by_path = {}
+            for path, call in calls.items():
+                recorder.reads.clear()
+                (await call()).raise_for_status()
+                reads_by_path[path] = list(recorder.reads)
+
+        for method, path, command, collection, expected in EXPECTATIONS:
+            members = {address for name, target, address in reads_by_path[path] if name == command and target == collection}
+            if not members:
+                verdict = "MISSING"
+            elif expected == "primary":
+                verdict = "ok" if members == {primary} else "FAIL"
+            else:
+                verdict = "ok" if members <= secondaries else "FAIL"
+            ok = ok and verdict == "ok"
+            served = ", ".join(f"{host}:{port}" for host, port in sorted(members)) or "-"
+            print(f"{verdict:<6} {method} {path:<30} {command} {collection:<13} expected {expected:<9} served by {served}")
+        return 0 if ok else 1
+    finally:
+        await server.app.router.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", default=os.environ.get("MONGO_URL", "mongodb://localhost:27010,localhost:27011,localhost:27012/?replicaSet=rs0"))
+    parser.add_argument("--db", default="joblens_routing")
+    args = parser.parse_args()
+    os.environ["MONGO_URL"] = args.url
+    os.environ["DB_NAME"] = args.db
+    sys.exit(asyncio.run(main_async()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+JobLens synthetic dataset generator
+Writes users, students, recruiters, jobs, courses and applications at benchmark scale using the server's Pydantic
+models. Skill, college, recruiter and job popularity follow Zipf distributions, so caches and indexes see a
+realistic skew. Output is deterministic for a given --seed: ids and rows are derived from (seed, collection,
+row number), independent of the number of workers.
+
+Every generated account uses the password given by --password (hashed once and shared).
+
+Usage: MONGO_URL=mongodb://localhost:27017 DB_NAME=joblens_bench python benchmarks/generate_dataset.py \\
+           --students 1000000 --jobs 100000 --applications 10000000 --workers 8 --drop
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from multiprocessing import Pool
+from pathlib import Path
+
+import numpy as np
+from pymongo import MongoClient, ReturnDocument
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "joblens_bench")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from server import (  # noqa: E402
+    INDEXES, Application, ApplicationStatus, Course, Job, JobType, Recruiter, Student, User,
+    UserRole, YearLevel, current_passout_year, hash_password, normalize_skill, skill_mask
+)
+
+SHARD_SIZE = 10000
+COLLECTIONS = ["users", "students", "recruiters", "jobs", "courses", "applications"]
+
+NAMED_SKILLS = [
+    "Resume Building", "Aptitude", "Communication", "Python", "SQL", "Java", "Excel", "JavaScript", "React",
+    "Data Structures", "Algorithms", "C++", "Machine Learning", "Git", "HTML", "CSS", "Node.js", "Statistics",
+    "Power BI", "Cloud Computing", "Docker", "Linux", "Public Speaking", "Tableau", "Spring Boot", "Django",
+    "MongoDB", "AWS", "Kubernetes", "Go", "TypeScript", "Figma", "Android", "Deep Learning", "Networking"
+]
+CITIES = [
+    "Delhi", "Mumbai", "Bangalore", "Chennai", "Hyderabad", "Pune", "Kolkata", "Ahmedabad", "Jaipur", "Lucknow",
+    "Bhopal", "Indore", "Nagpur", "Coimbatore", "Kochi", "Vellore", "Trichy", "Warangal", "Surat", "Patna"
+]
+COLLEGE_KINDS = [
+    "Institute of Technology", "College of Engineering", "University", "Institute of Engineering and Technology",
+    "Engineering College", "Institute of Information Technology", "School of Engineering"
+]
+BRANCHES = ["CSE", "IT", "ECE", "EEE", "Mechanical", "Civil", "Chemical"]
+TITLES = ["Software Engineer", "Data Analyst", "Frontend Developer", "Backend Developer", "ML Engineer",
+          "QA Engineer", "DevOps Engineer", "Product Analyst", "Business Analyst", "Android Developer"]
+# Share of applications at each pipeline stage
+STATUS_WEIGHTS = {
+    ApplicationStatus.APPLIED: 0.55, ApplicationStatus.SHORTLISTED: 0.15, ApplicationStatus.INTERVIEWING: 0.08,
+    ApplicationStatus.OFFERED: 0.03, ApplicationStatus.HIRED: 0.02, ApplicationStatus.REJECTED: 0.17
+}
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+HISTORY_SPAN_DAYS = 730
+
+
+def stable_id(seed: int, kind: str, index: int) -> str:
+    """UUID4-shaped id derived from the row, so other collections can reference it by row number"""
+    digest = hashlib.blake2b(f"{seed}:{kind}:{index}".encode(), digest_size=16).digest()
+    return str(uuid.UUID(bytes=digest, version=4))
+
+
+def shard_rng(seed: int, kind: str, shard: int) -> np.random.Generator:
+    return np.random.default_rng([seed, int.from_bytes(kind.encode(), "little"), shard])
+
+
+class ZipfSampler:
+    """Draws ranks 0..n-1 with probability proportional to 1 / (rank + 1) ** exponent"""
+    def __init__(self, n: int, exponent: float):
+        weights = 1.0 / np.arange(1, n + 1) ** exponent
+        self.cdf = np.cumsum(weights / weights.sum())
+        self.n = n
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        return np.minimum(np.searchsorted(self.cdf, rng.random(size)), self.n - 1)
+
+    def sample_distinct(self, rng: np.random.Generator, k: int) -> np.ndarray:
+        """Up to k distinct ranks, popular ones first more often"""
+        k = min(k, self.n)
+        chosen = np.zeros(0, dtype=np.int64)
+        for _ in range(8):
+            if len(chosen) >= k:
+                break
+            draws = np.concatenate([chosen, self.sample(rng, 2 * k)])
+            _, first = np.unique(draws, return_index=True)
+            chosen = draws[np.sort(first)]
+        return chosen[:k]
+
+
+def skill_names(count: int):
+    return (NAMED_SKILLS + [f"Skill {i}" for i in range(len(NAMED_SKILLS), count)])[:count]
+
+
+def college_names(count: int, seed: int):
+    rng = np.random.default_rng([seed, 0])
+    names = [f"{kind} {city}" for kind in COLLEGE_KINDS for city in CITIES]
+    names += [f"{CITIES[i % len(CITIES)]} {COLLEGE_KINDS[i % len(COLLEGE_KINDS)]} {i}" for i in range(len(names), count)]
+    names = names[:count]
+    # Popularity rank should not follow alphabetical order
+    return [names[i] for i in rng.permutation(len(names))]
+
+
+def spread_dates(rng: np.random.Generator, size: int):
+    offsets = rng.random(size) * HISTORY_SPAN_DAYS
+    return [EPOCH + timedelta(days=float(offset)) for offset in offsets]
+
+
+class Plan:
+    """Everything a worker needs to build any shard; small enough to pickle per task"""
+    def __init__(self, args, skill_bits: dict, password_hash: str):
+        self.seed = args.seed
+        self.mongo_url = os.environ["MONGO_URL"]
+        self.db_name = os.environ["DB_NAME"]
+        self.students = args.students
+        self.recruiters = args.recruiters
+        self.jobs = args.jobs
+        self.applications = args.applications
+        self.exponent = args.zipf
+        self.skills = skill_names(args.skills)
+        self.colleges = college_names(args.colleges, args.seed)
+        self.skill_bits = skill_bits
+        self.password_hash = password_hash
+
+    def mask(self, names):
+        # Only course skills have bits
+        return skill_mask([self.skill_bits[key] for key in map(normalize_skill, names) if key in self.skill_bits])
+
+
+def build_users_and_students(plan: Plan, shard: int):
+    rng = shard_rng(plan.seed, "students", shard)
+    start, end = shard * SHARD_SIZE, min((shard + 1) * SHARD_SIZE, plan.students)
+    size = end - start
+    skills = ZipfSampler(len(plan.skills), plan.exponent)
+    college_ranks = ZipfSampler(len(plan.colleges), plan.exponent).sample(rng, size)
+    passout = current_passout_year() + rng.integers(-1, 4, size)
+    skill_counts = np.minimum(rng.poisson(3, size), len(plan.skills))
+    created = spread_dates(rng, size)
+    users, students = [], []
+    for row in range(size):
+        index = start + row
+        user = User(
+            id=stable_id(plan.seed, "user-student", index),
+            email=f"student{index}@joblens.test",
+            password_hash=plan.password_hash,
+            role=UserRole.STUDENT,
+            name=f"Student {index}",
+            created_at=created[row]
+        )
+        completed = [plan.skills[rank] for rank in skills.sample_distinct(rng, int(skill_counts[row]))]
+        student = Student(
+            id=stable_id(plan.seed, "student", index),
+            user_id=user.id,
+            college=plan.colleges[college_ranks[row]],
+            branch=BRANCHES[int(rng.integers(len(BRANCHES)))],
+            year_of_passout=int(passout[row]),
+            completed_skills=completed
+        )
+        users.append(user.dict())
+        students.append({**student.dict(), "skill_mask": plan.mask(completed)})
+    return {"users": users, "students": students}
+
+
+def build_recruiters(plan: Plan, shard: int):
+    rng = shard_rng(plan.seed, "recruiters", shard)
+    start, end = shard * SHARD_SIZE, min((shard + 1) * SHARD_SIZE, plan.recruiters)
+    created = spread_dates(rng, end - start)
+    users, recruiters = [], []
+    for row, index in enumerate(range(start, end)):
+        user = User(
+            id=stable_id(plan.seed, "user-recruiter", index),
+            email=f"recruiter{index}@joblens.test",
+            password_hash=plan.password_hash,
+            role=UserRole.RECRUITER,
+            name=f"Recruiter {index}",
+            created_at=created[row],
+            is_verified=bool(rng.random() < 0.8)
+        )
+        recruiter = Recruiter(
+            id=stable_id(plan.seed, "recruiter", index),
+            user_id=user.id,
+            company=f"Company {index}",
+            position="Talent Acquisition",
+            is_verified=user.is_verified
+        )
+        users.append(user.dict())
+        recruiters.append(recruiter.dict())
+    return {"users": users, "recruiters": recruiters}
+
+
+def build_jobs(plan: Plan, shard: int):
+    rng = shard_rng(plan.seed, "jobs", shard)
+    start, end = shard * SHARD_SIZE, min((shard + 1) * SHARD_SIZE, plan.jobs)
+    size = end - start
+    skills = ZipfSampler(len(plan.skills), plan.exponent)
+    posters = ZipfSampler(plan.recruiters, plan.exponent).sample(rng, size)
+    created = spread_dates(rng, size)
+    year_levels = list(YearLevel)
+    jobs = []
+    for row in range(size):
+        index = start + row
+        internship = bool(rng.random() < 0.5)
+        required = [plan.skills[rank] for rank in skills.sample_distinct(rng, int(rng.integers(1, 6)))]
+        title = TITLES[int(rng.integers(len(TITLES)))]
+        job = Job(
+            id=stable_id(plan.seed, "job", index),
+            title=f"{title} {'Intern' if internship else ''}".strip(),
+            company=f"Company {posters[row]}",
+            location=f"{CITIES[int(rng.integers(len(CITIES)))]}, India",
+            description=f"Join our team as a {title.lower()} working with {', '.join(required)}.",
+            job_type=JobType.INTERNSHIP if internship else JobType.FULLTIME,
+            required_skills=required,
+            year_level=year_levels[int(rng.integers(len(year_levels)))] if internship else None,
+            experience_level=None if internship else ("fresher" if rng.random() < 0.7 else "experienced"),
+            salary=f"₹{int(rng.integers(3, 20))} LPA",
+            posted_by=stable_id(plan.seed, "user-recruiter", int(posters[row])),
+            created_at=created[row]
+        )
+        jobs.append({**job.dict(), "required_skill_mask": plan.mask(required)})
+    return {"jobs": jobs}
+
+
+def build_applications(plan: Plan, shard: int):
+    """Applications for one shard of students; each student applies to distinct jobs, popular jobs more often"""
+    rng = shard_rng(plan.seed, "applications", shard)
+    start, end = shard * SHARD_SIZE, min((shard + 1) * SHARD_SIZE, plan.students)
+    jobs = ZipfSampler(plan.jobs, plan.exponent)
+    per_student = rng.poisson(plan.applications / plan.students, end - start)
+    statuses = list(STATUS_WEIGHTS)
+    status_cdf = np.cumsum(list(STATUS_WEIGHTS.values()))
+    status_ranks = np.minimum(np.searchsorted(status_cdf, rng.random(int(per_student.sum()))), len(statuses) - 1)
+    applied_offsets = rng.random(len(status_ranks)) * HISTORY_SPAN_DAYS
+    changed_offsets = rng.random(len(status_ranks)) * 30
+    applications = []
+    for row, index in enumerate(range(start, end)):
+        student_user_id = stable_id(plan.seed, "user-student", index)
+        for job_rank in jobs.sample_distinct(rng, int(per_student[row])):
+            position = len(applications)
+            applied_at = EPOCH + timedelta(days=float(applied_offsets[position]))
+            status = statuses[status_ranks[position]]
+            application = Application(
+                id=stable_id(plan.seed, f"application-{index}", int(job_rank)),
+                student_id=student_user_id,
+                job_id=stable_id(plan.seed, "job", int(job_rank)),
+                status=status,
+                applied_at=applied_at
+            )
+            doc = application.dict()
+            if status != ApplicationStatus.APPLIED:
+                doc["status_history"] = [{
+                    "status": status,
+                    "changed_at": applied_at + timedelta(days=float(changed_offsets[position])),
+                    "changed_by": stable_id(plan.seed, "user-recruiter", 0)
+                }]
+            applications.append(doc)
+    return {"applications": applications}
+
+
+BUILDERS = {
+    "students": (build_users_and_students, lambda plan: plan.students),
+    "recruiters": (build_recruiters, lambda plan: plan.recruiters),
+    "jobs": (build_jobs, lambda plan: plan.jobs),
+    "applications": (build_applications, lambda plan: plan.students if plan.applications else 0)
+}
+
+_worker_db = None
+
+
+def _init_worker(mongo_url: str, db_name: str):
+    global _worker_db
+    _worker_db = MongoClient(mongo_url)[db_name]
+
+
+def _write_shard(task) -> dict:
+    plan, kind, shard = task
+    written = {}
+    for collection, docs in BUILDERS[kind][0](plan, shard).items():
+        if not docs:
+            continue
+        try:
+            written[collection] = len(_worker_db[collection].insert_many(docs, ordered=False).inserted_ids)
+        except BulkWriteError as error:
+            # Rerunning without --drop leaves existing rows in place
+            written[collection] = error.details["nInserted"]
+    return written
+
+
+def register_skills(db, names) -> dict:
+    """Bit positions from the skills collection, registering missing course skills the way the server does"""
+    bits = {doc["key"]: doc["bit"] for doc in db.skills.find({}, {"_id": 0, "key": 1, "bit": 1})}
+    for name in names:
+        key = normalize_skill(name)
+        if key in bits:
+            continue
+        counter = db.counters.find_one_and_update({"_id": "skill_bit"}, {"$inc": {"seq": 1}}, upsert=True, return_document=ReturnDocument.AFTER)
+        db.skills.insert_one({"key": key, "name": name, "bit": counter["seq"] - 1})
+        bits[key] = counter["seq"] - 1
+    return bits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--students", type=int, default=100000)
+    parser.add_argument("--recruiters", type=int, default=2000)
+    parser.add_argument("--jobs", type=int, default=10000)
+    parser.add_argument("--applications", type=int, default=1000000, help="approximate total")
+    parser.add_argument("--courses", type=int, default=30)
+    parser.add_argument("--skills", type=int, default=300, help="skill vocabulary size")
+    parser.add_argument("--colleges", type=int, default=3000)
+    parser.add_argument("--zipf", type=float, default=1.1, help="popularity skew exponent")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--password", default="Password123!")
+    parser.add_argument("--drop", action="store_true", help="drop the generated collections first")
+    args = parser.parse_args()
+    if args.recruiters < 1 and args.jobs:
+        parser.error("--jobs needs at least one recruiter")
+    if args.jobs < 1 and args.applications:
+        parser.error("--applications needs at least one job")
+
+    db = MongoClient(os.environ["MONGO_URL"])[os.environ["DB_NAME"]]
+    if args.drop:
+        for name in COLLECTIONS + ["skills", "counters", "stats", "activity", "imports"]:
+            db.drop_collection(name)
+
+    plan = Plan(args, register_skills(db, skill_names(args.skills)[:args.courses]), hash_password(args.password))
+
+    # Courses teach the most popular skills
+    courses = [
+        Course(id=stable_id(args.seed, "course", i), title=f"{name} Fundamentals", description=f"Learn and get verified in {name}",
+               skill_name=name, created_at=EPOCH).dict()
+        for i, name in enumerate(plan.skills[:args.courses])
+    ]
+    if courses:
+        try:
+            db.courses.insert_many(courses, ordered=False)
+        except BulkWriteError:
+            pass
+
+    admin = User(id=stable_id(args.seed, "user-admin", 0), email="admin@joblens.test", password_hash=plan.password_hash,
+                 role=UserRole.ADMIN, name="Admin", created_at=EPOCH, is_verified=True)
+    try:
+        db.users.insert_one(admin.dict())
+    except DuplicateKeyError:
+        pass
+
+    totals = dict.fromkeys(COLLECTIONS, 0)
+    totals["courses"] = len(courses)
+    with Pool(args.workers, initializer=_init_worker, initargs=(plan.mongo_url, plan.db_name)) as pool:
+        for kind, (_, rows) in BUILDERS.items():
+            started_at = time.perf_counter()
+            shards = (rows(plan) + SHARD_SIZE - 1) // SHARD_SIZE
+            for written in pool.imap_unordered(_write_shard, [(plan, kind, shard) for shard in range(shards)]):
+                for collection, count in written.items():
+                    totals[collection] += count
+            print(f"{kind:<13} {shards:>5} shards in {time.perf_counter() - started_at:.1f}s", file=sys.stderr)
+
+    # Indexes are built once after loading, which is much faster than maintaining them row by row
+    started_at = time.perf_counter()
+    for collection, indexes in INDEXES.items():
+        db[collection].create_indexes(indexes)
+    print(f"indexes built in {time.perf_counter() - started_at:.1f}s", file=sys.stderr)
+    print(totals)
+
+
+if __name__ == "__main__":
+    main()
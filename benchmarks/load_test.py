@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+JobLens async load test
+Drives concurrent user journeys (student browse-and-apply, recruiter search storm, admin dashboard refresh,
+login burst) against the API, either in-process through the ASGI app or over HTTP, and writes per-endpoint
+RPS, latency percentiles and error rates as JSON. With --baseline, exits non-zero when an endpoint regresses.
+
+Usage: MONGO_URL=mongodb://localhost:27017 DB_NAME=joblens_load python benchmarks/load_test.py --duration 30 --output report.json
+       python benchmarks/load_test.py --url http://localhost:8001 --scenario login_burst --baseline baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import sys
+import time
+import uuid
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+import httpx
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+
+SKILLS = ["Resume Building", "Aptitude", "Python", "SQL", "Communication", "Java", "React", "Excel"]
+COLLEGES = ["IIT Delhi", "NIT Trichy", "BITS Pilani", "VIT Vellore", "Anna University"]
+SEARCH_TERMS = ["engineer", "python", "data", "intern", "react", "analyst"]
+PASSWORD = "LoadTest#2024"
+
+
+def percentile(sorted_values, fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_values:
+        return 0.0
+    index = min(int(len(sorted_values) * fraction), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+class Recorder:
+    """Latencies and error counts per endpoint template"""
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    def record(self, endpoint: str, seconds: float, ok: bool):
+        self.latencies[endpoint].append(seconds)
+        if not ok:
+            self.errors[endpoint] += 1
+
+    def summary(self, elapsed: float) -> dict:
+        endpoints = {}
+        for endpoint, samples in sorted(self.latencies.items()):
+            samples = sorted(samples)
+            endpoints[endpoint] = {
+                "requests": len(samples),
+                "errors": self.errors[endpoint],
+                "error_rate": round(self.errors[endpoint] / len(samples), 4),
+                "rps": round(len(samples) / elapsed, 2),
+                "p50_ms": round(percentile(samples, 0.50) * 1000, 2),
+                "p95_ms": round(percentile(samples, 0.95) * 1000, 2),
+                "p99_ms": round(percentile(samples, 0.99) * 1000, 2),
+                "max_ms": round(samples[-1] * 1000, 2)
+            }
+        total = sum(endpoint["requests"] for endpoint in endpoints.values())
+        return {
+            "duration_s": round(elapsed, 2),
+            "requests": total,
+            "rps": round(total / elapsed, 2),
+            "errors": sum(self.errors.values()),
+            "endpoints": endpoints
+        }
+
+
+class Session:
+    """httpx client wrapper that times each call under its route template"""
+    def __init__(self, client: httpx.AsyncClient, recorder: Recorder):
+        self.client = client
+        self.recorder = recorder
+
+    async def call(self, method: str, template: str, token: str = None, expect=(), **kwargs):
+        path_params = kwargs.pop("path", {})
+        headers = kwargs.pop("headers", {})
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        started_at = time.perf_counter()
+        try:
+            response = await self.client.request(method, "/api" + template.format(**path_params), headers=headers, **kwargs)
+        except httpx.HTTPError:
+            self.recorder.record(f"{method} {template}", time.perf_counter() - started_at, False)
+            return None
+        ok = response.status_code < 400 or response.status_code in expect
+        self.recorder.record(f"{method} {template}", time.perf_counter() - started_at, ok)
+        return response if ok else None
+
+
+class Fixture:
+    """Accounts and jobs created once before the scenarios run"""
+    def __init__(self):
+        self.students = []  # (email, token)
+        self.recruiters = []  # (token, [job_ids])
+        self.admin_token = None
+        self.job_ids = []
+
+
+async def register(client: httpx.AsyncClient, role: str, name: str, run_id: str) -> tuple:
+    email = f"{role}-{name}-{run_id}@load.test"
+    response = await client.post("/api/auth/register", json={"email": email, "password": PASSWORD, "name": name, "role": role})
+    response.raise_for_status()
+    return email, response.json()["access_token"]
+
+
+async def build_fixture(client: httpx.AsyncClient, students: int, recruiters: int, jobs_per_recruiter: int, rng: random.Random) -> Fixture:
+    fixture = Fixture()
+    run_id = uuid.uuid4().hex[:8]
+    auth = lambda token: {"Authorization": f"Bearer {token}"}  # noqa: E731
+
+    _, fixture.admin_token = await register(client, "admin", "admin", run_id)
+
+    async def add_student(i: int):
+        email, token = await register(client, "student", f"student{i}", run_id)
+        response = await client.post("/api/students/profile", headers=auth(token), json={
+            "college": rng.choice(COLLEGES), "branch": "CSE", "year_of_passout": rng.randint(2025, 2028)
+        })
+        response.raise_for_status()
+        for skill in rng.sample(SKILLS, rng.randint(1, 4)):
+            await client.post(f"/api/students/complete-skill/{skill}", headers=auth(token))
+        fixture.students.append((email, token))
+
+    async def add_recruiter(i: int):
+        _, token = await register(client, "recruiter", f"recruiter{i}", run_id)
+        response = await client.post("/api/recruiters/profile", headers=auth(token), json={"company": f"Company {i}", "position": "Talent Lead"})
+        response.raise_for_status()
+        job_ids = []
+        for j in range(jobs_per_recruiter):
+            response = await client.post("/api/jobs", headers=auth(token), json={
+                "title": f"{rng.choice(['Software', 'Data', 'Frontend', 'Backend'])} Engineer {i}-{j}",
+                "company": f"Company {i}",
+                "location": "Bangalore, India",
+                "description": f"Work on {rng.choice(SEARCH_TERMS)} systems with a small team",
+                "job_type": rng.choice(["internship", "fulltime"]),
+                "required_skills": rng.sample(SKILLS, rng.randint(1, 3))
+            })
+            response.raise_for_status()
+            job_ids.append(response.json()["job_id"])
+        fixture.recruiters.append((token, job_ids))
+        fixture.job_ids.extend(job_ids)
+
+    await asyncio.gather(*(add_student(i) for i in range(students)), *(add_recruiter(i) for i in range(recruiters)))
+    return fixture
+
+
+# Scenarios: one user journey per call
+async def student_browse_apply(session: Session, fixture: Fixture, rng: random.Random):
+    _, token = rng.choice(fixture.students)
+    await session.call("GET", "/students/profile", token)
+    await session.call("GET", "/courses")
+    await session.call("GET", "/jobs", params={"limit": 50})
+    await session.call("GET", "/jobs/search", params={"q": rng.choice(SEARCH_TERMS)})
+    await session.call("GET", "/students/recommended-jobs", token)
+    # Students revisit the same fixed pool of jobs, so "Already applied" is an expected outcome, not an error
+    await session.call("POST", "/jobs/{job_id}/apply", token, expect=(400,), path={"job_id": rng.choice(fixture.job_ids)},
+                       headers={"Idempotency-Key": uuid.uuid4().hex})
+    await session.call("GET", "/students/applications", token)
+
+
+async def recruiter_search_storm(session: Session, fixture: Fixture, rng: random.Random):
+    token, job_ids = rng.choice(fixture.recruiters)
+    await session.call("POST", "/recruiters/search-students", token, json={
+        "college": rng.choice([None, rng.choice(COLLEGES)[:rng.randint(2, 6)]]),
+        "skills": rng.sample(SKILLS, rng.randint(1, 3)),
+        "skill_match": rng.choice(["any", "all"])
+    })
+    await session.call("GET", "/colleges/autocomplete", token, params={"prefix": rng.choice(COLLEGES)[:rng.randint(1, 4)]})
+    if job_ids:
+        job_id = rng.choice(job_ids)
+        await session.call("GET", "/jobs/{job_id}/candidates", token, path={"job_id": job_id})
+        await session.call("GET", "/jobs/{job_id}/applications", token, path={"job_id": job_id})
+
+
+async def admin_dashboard_refresh(session: Session, fixture: Fixture, rng: random.Random):
+    token = fixture.admin_token
+    await session.call("GET", "/admin/analytics", token)
+    await session.call("GET", "/admin/users", token, params={"limit": 100})
+    await session.call("GET", "/jobs", params={"limit": 100})
+    await session.call("GET", "/courses")
+
+
+async def login_burst(session: Session, fixture: Fixture, rng: random.Random):
+    email, _ = rng.choice(fixture.students)
+    await session.call("POST", "/auth/login", json={"email": email, "password": PASSWORD})
+
+
+SCENARIOS = {
+    "student_browse_apply": student_browse_apply,
+    "recruiter_search_storm": recruiter_search_storm,
+    "admin_dashboard_refresh": admin_dashboard_refresh,
+    "login_burst": login_burst
+}
+
+
+async def run_scenario(client: httpx.AsyncClient, journey, fixture: Fixture, concurrency: int, duration: float, seed: int) -> dict:
+    recorder = Recorder()
+    session = Session(client, recorder)
+    deadline = time.perf_counter() + duration
+
+    async def user(worker: int):
+        rng = random.Random(seed * 1000 + worker)
+        while time.perf_counter() < deadline:
+            await journey(session, fixture, rng)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(user(worker) for worker in range(concurrency)))
+    return recorder.summary(time.perf_counter() - started_at)
+
+
+@asynccontextmanager
+async def open_client(url: str, concurrency: int):
+    """HTTP client for a running server, or the ASGI app in this process with its startup hooks run"""
+    timeout = httpx.Timeout(60.0)
+    if url:
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(base_url=url, timeout=timeout, limits=limits) as client:
+            yield client
+        return
+
+    sys.path.insert(0, str(BACKEND_DIR))
+    from server import app  # noqa: E402
+    await app.router.startup()
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app, raise_app_exceptions=False), base_url="http://joblens", timeout=timeout) as client:
+            yield client
+    finally:
+        await app.router.shutdown()
+
+
+def compare(report: dict, baseline: dict, latency_tolerance: float, error_tolerance: float) -> list:
+    """Endpoints whose p95 or error rate got worse than the baseline allows"""
+    regressions = []
+    for scenario, result in report["scenarios"].items():
+        base_endpoints = baseline.get("scenarios", {}).get(scenario, {}).get("endpoints", {})
+        for endpoint, stats in result["endpoints"].items():
+            base = base_endpoints.get(endpoint)
+            if base is None:
+                continue
+            if stats["p95_ms"] > base["p95_ms"] * (1 + latency_tolerance):
+                regressions.append(f"{scenario}: {endpoint} p95 {base['p95_ms']}ms -> {stats['p95_ms']}ms")
+            if stats["error_rate"] > base["error_rate"] + error_tolerance:
+                regressions.append(f"{scenario}: {endpoint} error rate {base['error_rate']} -> {stats['error_rate']}")
+    return regressions
+
+
+async def main_async(args) -> int:
+    async with open_client(args.url, args.concurrency) as client:
+        rng = random.Random(args.seed)
+        fixture = await build_fixture(client, args.students, args.recruiters, args.jobs_per_recruiter, rng)
+
+        report = {
+            "meta": {
+                "started_at": datetime.now(timezone.utc).isoformat(),
+                "target": args.url or "in-process",
+                "concurrency": args.concurrency,
+                "duration_s": args.duration,
+                "seed": args.seed,
+                "python": platform.python_version()
+            },
+            "scenarios": {}
+        }
+        for name in args.scenario:
+            result = await run_scenario(client, SCENARIOS[name], fixture, args.concurrency, args.duration, args.seed)
+            report["scenarios"][name] = result
+            print(f"{name:<26} {result['rps']:>9.1f} rps  {result['requests']:>7} requests  {result['errors']:>5} errors", file=sys.stderr)
+            for endpoint, stats in result["endpoints"].items():
+                print(f"  {endpoint:<40} p50={stats['p50_ms']:>8.2f}ms p95={stats['p95_ms']:>8.2f}ms "
+                      f"p99={stats['p99_ms']:>8.2f}ms err={stats['error_rate']:.2%}", file=sys.stderr)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+
+    if args.baseline:
+        regressions = compare(report, json.loads(Path(args.baseline).read_text()), args.latency_tolerance, args.error_tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", help="base URL of a running server; omit to drive the app in-process")
+    parser.add_argument("--scenario", nargs="+", choices=sorted(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--concurrency", type=int, default=20, help="concurrent virtual users per scenario")
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds per scenario")
+    parser.add_argument("--students", type=int, default=50)
+    parser.add_argument("--recruiters", type=int, default=5)
+    parser.add_argument("--jobs-per-recruiter", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--baseline", help="previous JSON report to gate against")
+    parser.add_argument("--latency-tolerance", type=float, default=0.2, help="allowed fractional p95 increase")
+    parser.add_argument("--error-tolerance", type=float, default=0.01, help="allowed absolute error-rate increase")
+    args = parser.parse_args()
+
+    os.environ.setdefault("DB_NAME", "joblens_load")
+    sys.exit(asyncio.run(main_async(args)))
+
+
+if __name__ == "__main__":
+    main()
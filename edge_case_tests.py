@@ -7,6 +7,7 @@ Tests edge cases and error conditions
 import requests
 import json
 import os
+import uuid
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -15,6 +16,66 @@ load_dotenv('/app/frontend/.env')
 BASE_URL = os.getenv('REACT_APP_BACKEND_URL', 'https://joblens.preview.emergentagent.com')
 API_URL = f"{BASE_URL}/api"
 
+# Per-request cap passed to POST /jobs/bulk, so the limit tests only post a handful of jobs
+BULK_TEST_MAX_ITEMS = 5
+
+# Suffix for emails and titles so reruns against the same database don't collide
+RUN_ID = uuid.uuid4().hex[:8]
+
+def register_user(role, name):
+    """Register a fresh user for this run and return its auth headers, or None on failure"""
+    user_data = {
+        "email": f"{name.lower().replace(' ', '.')}.{RUN_ID}@{role}.test",
+        "password": "TestPass123!",
+        "name": name,
+        "role": role
+    }
+    response = requests.post(f"{API_URL}/auth/register", json=user_data)
+    if response.status_code != 200:
+        return None
+    return {'Authorization': f"Bearer {response.json()['access_token']}", 'Content-Type': 'application/json'}
+
+def register_student(name, college="Test University", year_of_passout=2025):
+    """Register a student with a profile and return its auth headers, or None on failure"""
+    headers = register_user("student", name)
+    if headers is None:
+        return None
+    profile_data = {
+        "college": college,
+        "branch": "Computer Science",
+        "year_of_passout": year_of_passout
+    }
+    response = requests.post(f"{API_URL}/students/profile", json=profile_data, headers=headers)
+    return headers if response.status_code == 200 else None
+
+def register_recruiter(name):
+    """Register a recruiter with a profile and return its auth headers, or None on failure"""
+    headers = register_user("recruiter", name)
+    if headers is None:
+        return None
+    recruiter_profile = {
+        "company": "Test Company",
+        "position": "Recruiter"
+    }
+    response = requests.post(f"{API_URL}/recruiters/profile", json=recruiter_profile, headers=headers)
+    return headers if response.status_code == 200 else None
+
+def job_payload(title):
+    return {
+        "title": title,
+        "company": "Test Company",
+        "location": "Test Location",
+        "description": "Test Description",
+        "job_type": "internship",
+        "required_skills": ["Python"],
+        "year_level": "3rd"
+    }
+
+def post_job(headers, title):
+    """Post a job and return its id, or None on failure"""
+    response = requests.post(f"{API_URL}/jobs", json=job_payload(title), headers=headers)
+    return response.json()['job_id'] if response.status_code == 200 else None
+
 def test_duplicate_registration():
     """Test duplicate email registration"""
     user_data = {
@@ -188,6 +249,432 @@ def test_nonexistent_job_application():
     else:
         print(f"❌ FAIL: Expected 404, got {response.status_code}")
 
+def test_idempotent_job_application():
+    """Test that only a retry carrying the original Idempotency-Key repeats the success response"""
+    student_headers = register_student("Idempotent Student")
+    recruiter_headers = register_recruiter("Idempotent Recruiter")
+    if student_headers is None or recruiter_headers is None:
+        print("❌ FAIL: Could not register users for idempotent application test")
+        return
+    
+    job_title = f"Idempotent Job {RUN_ID}"
+    job_id = post_job(recruiter_headers, job_title)
+    if job_id is None:
+        print("❌ FAIL: Could not create job for idempotent application test")
+        return
+    
+    key = str(uuid.uuid4())
+    response1 = requests.post(f"{API_URL}/jobs/{job_id}/apply", headers={**student_headers, 'Idempotency-Key': key})
+    print(f"First application with key: {response1.status_code}")
+    
+    # Retry with the same key, e.g. after a dropped response
+    response2 = requests.post(f"{API_URL}/jobs/{job_id}/apply", headers={**student_headers, 'Idempotency-Key': key})
+    print(f"Retry with the same key: {response2.status_code}")
+    
+    # Repeat without any key
+    response3 = requests.post(f"{API_URL}/jobs/{job_id}/apply", headers=student_headers)
+    print(f"Repeat without a key: {response3.status_code}")
+    
+    # Repeat with a different key
+    response4 = requests.post(f"{API_URL}/jobs/{job_id}/apply", headers={**student_headers, 'Idempotency-Key': str(uuid.uuid4())})
+    print(f"Repeat with a different key: {response4.status_code}")
+    
+    if response1.status_code != 200:
+        print(f"❌ FAIL: Expected 200 for the first application, got {response1.status_code}")
+    elif response2.status_code != 200 or response2.json().get("message") != "Application submitted successfully":
+        print(f"❌ FAIL: Expected the original 200 response for a same-key retry, got {response2.status_code}")
+    elif response3.status_code != 400:
+        print(f"❌ FAIL: Expected 400 for a repeat without a key, got {response3.status_code}")
+    elif response4.status_code != 400:
+        print(f"❌ FAIL: Expected 400 for a repeat with a different key, got {response4.status_code}")
+    else:
+        print("✅ PASS: Idempotency-Key retries succeed and other repeats are rejected")
+    
+    # The retry must not have created a second application
+    applications = requests.get(f"{API_URL}/students/applications", headers=student_headers).json()
+    count = sum(1 for application in applications if application["job_title"] == job_title)
+    if count == 1:
+        print("✅ PASS: Retried application stored once")
+    else:
+        print(f"❌ FAIL: Expected 1 stored application, found {count}")
+
+def test_bulk_job_results():
+    """Test that bulk posting reports a result per item for JSON arrays and NDJSON streams"""
+    recruiter_headers = register_recruiter("Bulk Recruiter")
+    if recruiter_headers is None:
+        print("❌ FAIL: Could not register recruiter for bulk job test")
+        return
+    
+    # The middle item is missing its title
+    invalid_job = job_payload(f"Bulk Job {RUN_ID}")
+    del invalid_job["title"]
+    payloads = [job_payload(f"Bulk Job {RUN_ID} A"), invalid_job, job_payload(f"Bulk Job {RUN_ID} B")]
+    
+    response = requests.post(f"{API_URL}/jobs/bulk", json=payloads, headers=recruiter_headers)
+    print(f"Bulk JSON array: {response.status_code}")
+    if response.status_code != 200:
+        print(f"❌ FAIL: Expected 200, got {response.status_code}")
+    else:
+        data = response.json()
+        results = data["results"]
+        if (data["inserted"] == 2 and data["failed"] == 1 and data["truncated"] is False
+                and [result["index"] for result in results] == [0, 1, 2]
+                and "job_id" in results[0] and results[1].get("error") == "Invalid job" and "job_id" in results[2]):
+            print("✅ PASS: JSON array reports inserted and failed items by index")
+        else:
+            print("❌ FAIL: Unexpected bulk results", data)
+    
+    # NDJSON with an unparseable line in the middle
+    lines = [json.dumps(payloads[0]), "{not json", json.dumps(payloads[2])]
+    ndjson_headers = {**recruiter_headers, 'Content-Type': 'application/x-ndjson'}
+    response = requests.post(f"{API_URL}/jobs/bulk", data="\n".join(lines).encode(), headers=ndjson_headers)
+    print(f"Bulk NDJSON stream: {response.status_code}")
+    if response.status_code != 200:
+        print(f"❌ FAIL: Expected 200, got {response.status_code}")
+    else:
+        data = response.json()
+        results = data["results"]
+        if (data["inserted"] == 2 and data["failed"] == 1
+                and results[1] == {"index": 1, "error": "Invalid JSON"} and "job_id" in results[2]):
+            print("✅ PASS: NDJSON stream reports inserted and failed items by index")
+        else:
+            print("❌ FAIL: Unexpected bulk results", data)
+
+def test_bulk_job_limit():
+    """Test that bulk posting rejects oversized arrays and truncates oversized NDJSON streams"""
+    recruiter_headers = register_recruiter("Bulk Limit Recruiter")
+    if recruiter_headers is None:
+        print("❌ FAIL: Could not register recruiter for bulk limit test")
+        return
+    
+    title = f"Bulk Limit Job {RUN_ID}"
+    payloads = [job_payload(title)] * (BULK_TEST_MAX_ITEMS + 1)
+    params = {"max_items": BULK_TEST_MAX_ITEMS}
+    
+    # A JSON array over the limit is rejected before anything is saved
+    response = requests.post(f"{API_URL}/jobs/bulk", json=payloads, params=params, headers=recruiter_headers)
+    print(f"Bulk JSON array over the limit: {response.status_code}")
+    latest_jobs = requests.get(f"{API_URL}/jobs", params={"limit": 10}).json()["jobs"]
+    if response.status_code != 413:
+        print(f"❌ FAIL: Expected 413, got {response.status_code}")
+    elif any(job["title"] == title for job in latest_jobs):
+        print("❌ FAIL: Jobs from a rejected array were saved")
+    else:
+        print("✅ PASS: Oversized JSON array rejected without saving jobs")
+    
+    # An NDJSON stream over the limit saves the first max_items jobs and reports the rest as not read
+    ndjson_headers = {**recruiter_headers, 'Content-Type': 'application/x-ndjson'}
+    body = "\n".join(json.dumps(payload) for payload in payloads).encode()
+    response = requests.post(f"{API_URL}/jobs/bulk", data=body, params=params, headers=ndjson_headers)
+    print(f"Bulk NDJSON stream over the limit: {response.status_code}")
+    if response.status_code != 200:
+        print(f"❌ FAIL: Expected 200, got {response.status_code}")
+    else:
+        data = response.json()
+        if (data["truncated"] is True and data["inserted"] == BULK_TEST_MAX_ITEMS
+                and [result["index"] for result in data["results"]] == list(range(BULK_TEST_MAX_ITEMS))):
+            print(f"✅ PASS: Oversized NDJSON stream truncated after {BULK_TEST_MAX_ITEMS} saved jobs")
+        else:
+            print("❌ FAIL: Unexpected truncated summary", {key: data.get(key) for key in ("inserted", "failed", "truncated")})
+    
+    # A stream of exactly max_items is not truncated
+    body = "\n".join(json.dumps(payload) for payload in payloads[:BULK_TEST_MAX_ITEMS]).encode()
+    response = requests.post(f"{API_URL}/jobs/bulk", data=body, params=params, headers=ndjson_headers)
+    if response.status_code == 200 and response.json()["truncated"] is False:
+        print("✅ PASS: Stream within the limit not truncated")
+    else:
+        print(f"❌ FAIL: Expected an untruncated 200, got {response.status_code} {response.text}")
+
+def test_logout_revokes_token():
+    """Test that a logged-out token is rejected while a fresh login still works"""
+    user_data = {
+        "email": f"logout.student.{RUN_ID}@university.edu",
+        "password": "TestPass123!",
+        "name": "Logout Student",
+        "role": "student"
+    }
+    reg_response = requests.post(f"{API_URL}/auth/register", json=user_data)
+    if reg_response.status_code != 200:
+        print("❌ FAIL: Could not register user for logout test")
+        return
+    
+    headers = {'Authorization': f"Bearer {reg_response.json()['access_token']}"}
+    response1 = requests.get(f"{API_URL}/students/applications", headers=headers)
+    print(f"Request before logout: {response1.status_code}")
+    
+    logout_response = requests.post(f"{API_URL}/auth/logout", headers=headers)
+    print(f"Logout: {logout_response.status_code}")
+    
+    response2 = requests.get(f"{API_URL}/students/applications", headers=headers)
+    print(f"Request after logout: {response2.status_code}")
+    
+    login_response = requests.post(f"{API_URL}/auth/login", json={"email": user_data["email"], "password": user_data["password"]})
+    new_headers = {'Authorization': f"Bearer {login_response.json()['access_token']}"}
+    response3 = requests.get(f"{API_URL}/students/applications", headers=new_headers)
+    print(f"Request with a new login: {response3.status_code}")
+    
+    if response1.status_code != 200 or logout_response.status_code != 200:
+        print(f"❌ FAIL: Expected 200 before and at logout, got {response1.status_code} and {logout_response.status_code}")
+    elif response2.status_code != 401 or response2.json().get("detail") != "Token revoked":
+        print(f"❌ FAIL: Expected 401 'Token revoked' after logout, got {response2.status_code}")
+    elif response3.status_code != 200:
+        print(f"❌ FAIL: Expected 200 with a new login, got {response3.status_code}")
+    else:
+        print("✅ PASS: Logged-out token rejected, new login accepted")
+
+def test_verify_refreshes_principal():
+    """Test that profile creation and verification show up on the next request despite the cached principal,
+    which serves the recruiter profile's is_verified flag"""
+    recruiter_data = {
+        "email": f"verify.recruiter.{RUN_ID}@company.com",
+        "password": "TestPass123!",
+        "name": "Verify Recruiter",
+        "role": "recruiter"
+    }
+    recruiter_reg = requests.post(f"{API_URL}/auth/register", json=recruiter_data)
+    admin_headers = register_user("admin", "Verify Admin")
+    if recruiter_reg.status_code != 200 or admin_headers is None:
+        print("❌ FAIL: Could not register users for verify test")
+        return
+    
+    recruiter_id = recruiter_reg.json()['user_id']
+    recruiter_headers = {'Authorization': f"Bearer {recruiter_reg.json()['access_token']}", 'Content-Type': 'application/json'}
+    
+    # Resolve the principal before the profile exists
+    missing = requests.get(f"{API_URL}/recruiters/profile", headers=recruiter_headers)
+    print(f"Profile before creation: {missing.status_code}")
+    requests.post(f"{API_URL}/recruiters/profile", json={"company": "Test Company", "position": "Recruiter"}, headers=recruiter_headers)
+    
+    # Load the profile once so the principal is cached as unverified
+    before = requests.get(f"{API_URL}/recruiters/profile", headers=recruiter_headers)
+    print(f"Profile after creation: {before.status_code}, verified: {before.json().get('is_verified')}")
+    
+    verify_response = requests.put(f"{API_URL}/admin/users/{recruiter_id}/verify", headers=admin_headers)
+    print(f"Verify: {verify_response.status_code}")
+    
+    after = requests.get(f"{API_URL}/recruiters/profile", headers=recruiter_headers).json()
+    print(f"Verified after: {after.get('is_verified')}")
+    
+    if missing.status_code != 404 or before.status_code != 200:
+        print(f"❌ FAIL: Expected 404 then 200 around profile creation, got {missing.status_code} and {before.status_code}")
+    elif before.json().get("is_verified") is not False or verify_response.status_code != 200:
+        print("❌ FAIL: Could not set up an unverified recruiter")
+    elif after.get("is_verified") is True and after.get("name") == recruiter_data["name"]:
+        print("✅ PASS: Profile creation and verification visible on the next request")
+    else:
+        print("❌ FAIL: Stale principal after verification", after)
+
+def test_etag_revalidation():
+    """Test that course and job listings revalidate with 304 and that writes change their ETag"""
+    admin_headers = register_user("admin", "ETag Admin")
+    recruiter_headers = register_recruiter("ETag Recruiter")
+    if admin_headers is None or recruiter_headers is None:
+        print("❌ FAIL: Could not register users for ETag test")
+        return
+    
+    checks = []
+    for name, url, write in [
+        ("courses", f"{API_URL}/courses", lambda: requests.post(
+            f"{API_URL}/admin/courses",
+            json={"title": f"ETag Course {RUN_ID}", "description": "Test Description", "skill_name": f"ETag Skill {RUN_ID}"},
+            headers=admin_headers
+        ).status_code == 200),
+        ("jobs", f"{API_URL}/jobs", lambda: post_job(recruiter_headers, f"ETag Job {RUN_ID}") is not None),
+    ]:
+        first = requests.get(url)
+        etag = first.headers.get("ETag")
+        revalidated = requests.get(url, headers={"If-None-Match": etag})
+        written = write()
+        after = requests.get(url, headers={"If-None-Match": etag})
+        print(f"{name}: {first.status_code} then {revalidated.status_code}, after write {after.status_code}")
+        checks.append((
+            name,
+            first.status_code == 200 and etag is not None,
+            revalidated.status_code == 304 and revalidated.headers.get("ETag") == etag,
+            written and after.status_code == 200 and after.headers.get("ETag") not in (None, etag)
+        ))
+    
+    failed = [check for check in checks if not all(check[1:])]
+    if failed:
+        print("❌ FAIL: ETag revalidation or invalidation broken for", [check[0] for check in failed])
+    else:
+        print("✅ PASS: Listings revalidate with 304 and writes change the ETag")
+
+def test_dashboard_not_modified():
+    """Test that the student dashboard parses as JSON and skips sections whose ETag the client already has"""
+    student_headers = register_student("Dashboard Student")
+    if student_headers is None:
+        print("❌ FAIL: Could not register student for dashboard test")
+        return
+    
+    first = requests.get(f"{API_URL}/students/dashboard", headers=student_headers)
+    try:
+        sections = first.json()
+    except ValueError:
+        print(f"❌ FAIL: Dashboard is not valid JSON ({first.status_code})")
+        return
+    print(f"Dashboard: {first.status_code}, sections: {sorted(sections)}")
+    
+    known = [sections["courses"]["etag"], sections["jobs"]["etag"]]
+    second = requests.get(f"{API_URL}/students/dashboard", headers={**student_headers, "If-None-Match": ", ".join(known)}).json()
+    print(f"Not modified: {sorted(name for name, section in second.items() if section.get('not_modified'))}")
+    
+    if any("data" not in section for section in sections.values()):
+        print("❌ FAIL: First dashboard load is missing section data", sections)
+    elif second["courses"] != {"etag": known[0], "not_modified": True} or second["jobs"] != {"etag": known[1], "not_modified": True}:
+        print("❌ FAIL: Known sections were sent again", second)
+    elif second["profile"].get("data") != sections["profile"]["data"] or "data" not in second["applications"]:
+        print("❌ FAIL: Unknown sections were not sent", second)
+    else:
+        print("✅ PASS: Dashboard parses and skips known sections")
+
+def test_skill_match_search():
+    """Test any/all skill matching in student search, including skills no student has"""
+    college = f"Mask College {RUN_ID}"
+    both_headers = register_student("Mask Both", college=college)
+    python_headers = register_student("Mask Python", college=college)
+    recruiter_headers = register_recruiter("Mask Recruiter")
+    if both_headers is None or python_headers is None or recruiter_headers is None:
+        print("❌ FAIL: Could not register users for skill match test")
+        return
+    
+    for skill in ["Python", "SQL"]:
+        requests.post(f"{API_URL}/students/complete-skill/{skill}", headers=both_headers)
+    requests.post(f"{API_URL}/students/complete-skill/Python", headers=python_headers)
+    
+    unknown_skill = f"Unknown Skill {RUN_ID}"
+    cases = [
+        ("any", ["SQL"], {"Mask Both"}),
+        ("any", ["Python"], {"Mask Both", "Mask Python"}),
+        ("all", ["Python", "SQL"], {"Mask Both"}),
+        ("any", ["SQL", unknown_skill], {"Mask Both"}),
+        ("any", [unknown_skill], set()),
+        ("all", ["Python", unknown_skill], set())
+    ]
+    for skill_match, skills, expected in cases:
+        search_data = {"college": college, "skills": skills, "skill_match": skill_match}
+        response = requests.post(f"{API_URL}/recruiters/search-students", json=search_data, headers=recruiter_headers)
+        names = {student["name"] for student in response.json()} if response.status_code == 200 else None
+        label = f"{skill_match} of {skills}"
+        if names == expected:
+            print(f"✅ PASS: Search {label} returned {sorted(names)}")
+        else:
+            print(f"❌ FAIL: Search {label} expected {sorted(expected)}, got {response.status_code} {names}")
+
+def test_job_feed_cursor():
+    """Test that following next_cursor through the job feed returns every job once, newest first"""
+    recruiter_headers = register_recruiter("Cursor Recruiter")
+    if recruiter_headers is None:
+        print("❌ FAIL: Could not register recruiter for job feed cursor test")
+        return
+    
+    job_ids = [post_job(recruiter_headers, f"Cursor Job {RUN_ID} {i}") for i in range(5)]
+    if None in job_ids:
+        print("❌ FAIL: Could not create jobs for job feed cursor test")
+        return
+    
+    # The new jobs are the newest, so they fill the first three pages of two
+    seen = []
+    cursor = None
+    for _ in range(3):
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        data = requests.get(f"{API_URL}/jobs", params=params).json()
+        seen.extend(job["id"] for job in data["jobs"])
+        cursor = data["next_cursor"]
+    created = [job_id for job_id in seen if job_id in job_ids]
+    print(f"Job ids over three pages: {len(seen)} seen, {len(created)} of ours")
+    
+    if len(seen) != len(set(seen)):
+        print("❌ FAIL: A job appeared on more than one page")
+    elif created != list(reversed(job_ids)):
+        print("❌ FAIL: Expected our jobs newest first across pages", created)
+    else:
+        print("✅ PASS: Job feed pages are disjoint and newest first")
+    
+    response = requests.get(f"{API_URL}/jobs", params={"cursor": "not-a-cursor"})
+    if response.status_code == 400:
+        print("✅ PASS: Malformed cursor rejected")
+    else:
+        print(f"❌ FAIL: Expected 400 for a malformed cursor, got {response.status_code}")
+
+def walk_pages(url, key, params, headers=None, max_pages=50):
+    """Follow next_cursor from the first page, returning every item and the number of pages fetched"""
+    items = []
+    pages = 0
+    cursor = None
+    while pages < max_pages:
+        response = requests.get(url, params={**params, **({"cursor": cursor} if cursor else {})}, headers=headers)
+        if response.status_code != 200:
+            raise AssertionError(f"page {pages + 1} returned {response.status_code}: {response.text}")
+        data = response.json()
+        items.extend(data[key])
+        pages += 1
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+    return items, pages
+
+def test_applicant_pipeline_cursor():
+    """Test that following next_cursor through a job's applicants returns every application once"""
+    recruiter_headers = register_recruiter("Pipeline Recruiter")
+    if recruiter_headers is None:
+        print("❌ FAIL: Could not register recruiter for applicant pipeline cursor test")
+        return
+    
+    job_id = post_job(recruiter_headers, f"Pipeline Job {RUN_ID}")
+    if job_id is None:
+        print("❌ FAIL: Could not create job for applicant pipeline cursor test")
+        return
+    
+    for i in range(5):
+        student_headers = register_student(f"Pipeline Student {i}")
+        if student_headers is None:
+            print("❌ FAIL: Could not register students for applicant pipeline cursor test")
+            return
+        requests.post(f"{API_URL}/jobs/{job_id}/apply", headers=student_headers)
+    
+    try:
+        applications, pages = walk_pages(f"{API_URL}/jobs/{job_id}/applications", "applications", {"limit": 2}, recruiter_headers)
+    except AssertionError as e:
+        print(f"❌ FAIL: {e}")
+        return
+    application_ids = [application["application_id"] for application in applications]
+    print(f"Applicants over {pages} pages: {len(application_ids)}")
+    
+    if pages != 3 or len(application_ids) != 5 or len(set(application_ids)) != 5:
+        print(f"❌ FAIL: Expected 5 distinct applications over 3 pages, got {len(set(application_ids))} over {pages}")
+    elif [application["applied_at"] for application in applications] != sorted((application["applied_at"] for application in applications), reverse=True):
+        print("❌ FAIL: Applicants not ordered newest first across pages")
+    else:
+        print("✅ PASS: Applicant pages are disjoint, complete and newest first")
+
+def test_job_search_cursor():
+    """Test that following next_cursor through search results returns every match once"""
+    recruiter_headers = register_recruiter("Search Recruiter")
+    if recruiter_headers is None:
+        print("❌ FAIL: Could not register recruiter for job search cursor test")
+        return
+    
+    # A made-up word only this run's jobs contain
+    keyword = f"searchcursor{RUN_ID}"
+    job_ids = [post_job(recruiter_headers, f"{keyword} Engineer {i}") for i in range(5)]
+    if None in job_ids:
+        print("❌ FAIL: Could not create jobs for job search cursor test")
+        return
+    
+    try:
+        jobs, pages = walk_pages(f"{API_URL}/jobs/search", "jobs", {"q": keyword, "limit": 2})
+    except AssertionError as e:
+        print(f"❌ FAIL: {e}")
+        return
+    found_ids = [job["id"] for job in jobs]
+    print(f"Search results over {pages} pages: {len(found_ids)}")
+    
+    if pages != 3 or len(found_ids) != 5 or set(found_ids) != set(job_ids):
+        print(f"❌ FAIL: Expected our 5 jobs over 3 pages, got {len(set(found_ids) & set(job_ids))} over {pages}")
+    else:
+        print("✅ PASS: Search pages are disjoint and complete")
+
 if __name__ == "__main__":
     print("🧪 Running Edge Case Tests")
     print("=" * 30)
@@ -199,6 +686,28 @@ if __name__ == "__main__":
     test_duplicate_job_application()
     print()
     test_nonexistent_job_application()
+    print()
+    test_idempotent_job_application()
+    print()
+    test_bulk_job_results()
+    print()
+    test_bulk_job_limit()
+    print()
+    test_logout_revokes_token()
+    print()
+    test_verify_refreshes_principal()
+    print()
+    test_etag_revalidation()
+    print()
+    test_dashboard_not_modified()
+    print()
+    test_skill_match_search()
+    print()
+    test_job_feed_cursor()
+    print()
+    test_applicant_pipeline_cursor()
+    print()
+    test_job_search_cursor()
     
     print("\n" + "=" * 30)
     print("Edge case tests completed!")
\ No newline at end of file
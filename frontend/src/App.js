@@ -30,6 +30,8 @@ const AuthProvider = ({ children }) => {
   };
 
   const logout = () => {
+    // Revoke the token server-side; local logout proceeds even if this fails
+    axios.post(`${API}/auth/logout`).catch(() => {});
     localStorage.removeItem('token');
     localStorage.removeItem('user');
     delete axios.defaults.headers.common['Authorization'];
@@ -411,38 +413,34 @@ const StudentDashboard = () => {
   const { user, logout } = useAuth();
 
   useEffect(() => {
-    fetchProfile();
-    fetchCourses();
-    fetchJobs();
-    fetchApplications();
+    fetchDashboard();
   }, []);
 
-  const fetchProfile = async () => {
+  const fetchDashboard = async () => {
     try {
-      const response = await axios.get(`${API}/students/profile`);
-      setProfile(response.data);
-    } catch (err) {
-      if (err.response?.status === 404) {
+      const response = await axios.get(`${API}/students/dashboard`);
+      const { profile, courses, jobs, applications } = response.data;
+      if (profile.data) {
+        setProfile(profile.data);
+      } else {
         setShowProfileModal(true);
       }
-    }
-  };
-
-  const fetchCourses = async () => {
-    try {
-      const response = await axios.get(`${API}/courses`);
-      setCourses(response.data);
+      setCourses(courses.data);
+      setJobs(jobs.data.jobs);
+      setApplications(applications.data);
     } catch (err) {
-      console.error('Failed to fetch courses');
+      console.error('Failed to fetch dashboard');
     }
   };
 
-  const fetchJobs = async () => {
+  const fetchProfile = async () => {
     try {
-      const response = await axios.get(`${API}/jobs`);
-      setJobs(response.data);
+      const response = await axios.get(`${API}/students/profile`);
+      setProfile(response.data);
     } catch (err) {
-      console.error('Failed to fetch jobs');
+      if (err.response?.status === 404) {
+        setShowProfileModal(true);
+      }
     }
   };
 
@@ -1016,14 +1014,14 @@ const AdminDashboard = () => {
       ]);
 
       setCourses(coursesRes.data);
-      setJobs(jobsRes.data);
+      setJobs(jobsRes.data.jobs);
       
       // Update stats
       setStats({
         totalStudents: 150, // Mock data for now
         totalRecruiters: 25,
         totalCourses: coursesRes.data.length,
-        totalJobs: jobsRes.data.length
+        totalJobs: jobsRes.data.jobs.length
       });
     } catch (err) {
       console.error('Failed to fetch dashboard data');
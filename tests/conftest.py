@@ -0,0 +1,8 @@
+import os
+import sys
+from pathlib import Path
+
+# server builds its Mongo client at import time; the unit tests here never send it a command
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "joblens_test")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
@@ -0,0 +1,180 @@
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from server import (
+    EXTRA_SKILLS_CAP, MATCH_WEIGHTS, SkillMatrix, _encode_job_row, candidate_scores, current_passout_year,
+    eligible_jobs, job_snapshot, study_years, top_k, year_fit
+)
+
+# Last day of the 2025-26 academic year, and the first day of the next
+JUNE_30 = datetime(2026, 6, 30, tzinfo=timezone.utc)
+JULY_1 = datetime(2026, 7, 1, tzinfo=timezone.utc)
+ALL_STUDY_YEARS = np.arange(6)
+
+
+def student_matrix(rows):
+    """SkillMatrix of (id, bits, year_of_passout) rows"""
+    matrix = SkillMatrix({"year_of_passout": np.int32})
+    for student_id, bits, year_of_passout in rows:
+        matrix.upsert(student_id, bits, year_of_passout=year_of_passout)
+    return matrix
+
+
+def test_passout_year_rolls_over_after_june():
+    assert current_passout_year(JUNE_30) == 2026
+    assert current_passout_year(JULY_1) == 2027
+
+
+@pytest.mark.parametrize("today, expected", [
+    # Passing out in 2026 is final year until June ends, then graduated
+    (JUNE_30, {2020: 5, 2025: 5, 2026: 4, 2027: 3, 2029: 1, 2030: 0}),
+    (JULY_1, {2020: 5, 2025: 5, 2026: 5, 2027: 4, 2029: 2, 2030: 1, 2031: 0}),
+])
+def test_study_years_around_june_rollover(today, expected):
+    assert study_years(list(expected), today).tolist() == list(expected.values())
+    assert int(study_years(2026, today)) == expected[2026]
+
+
+@pytest.mark.parametrize("job, expected", [
+    # Fresher full-time roles: final-year students and graduates
+    ({"job_type": "fulltime", "experience_level": "fresher"}, [0, 0, 0, 0, 1, 1]),
+    ({"job_type": "fulltime"}, [0, 0, 0, 0, 1, 1]),
+    # Experienced full-time roles: graduates only
+    ({"job_type": "fulltime", "experience_level": "experienced"}, [0, 0, 0, 0, 0, 1]),
+    # Internships for a year level: exact year, half credit for adjacent years, never outside college
+    ({"job_type": "internship", "year_level": "3rd"}, [0, 0, 0.5, 1, 0.5, 0]),
+    ({"job_type": "internship", "year_level": "1st"}, [0, 1, 0.5, 0, 0, 0]),
+    ({"job_type": "internship", "year_level": "final"}, [0, 0, 0, 0.5, 1, 0]),
+    # Internships without a year level: anyone in college, half credit for graduates
+    ({"job_type": "internship", "year_level": None}, [0, 1, 1, 1, 1, 0.5]),
+])
+def test_year_fit(job, expected):
+    assert year_fit(ALL_STUDY_YEARS, job).tolist() == expected
+
+
+def test_coverage_counts_duplicate_required_skills_once():
+    # Python is bit 0, SQL bit 1
+    matrix = student_matrix([("both", [0, 1], 2026), ("python", [0], 2026), ("none", [], 2026)])
+    job = {"job_type": "fulltime", "required_skills": ["Python", " python ", "PYTHON"]}
+    scores, fit = candidate_scores(matrix, job, [0, 0, 0], JUNE_30)
+    assert fit.tolist() == [1.0, 1.0, 1.0]
+    extra = MATCH_WEIGHTS["extra_skills"] / EXTRA_SKILLS_CAP
+    assert scores.tolist() == pytest.approx([0.6 + 0.3 + extra, 0.6 + 0.3, 0.3])
+
+
+def test_coverage_keeps_unknown_required_skills_in_the_denominator():
+    matrix = student_matrix([("both", [0, 1], 2026), ("python", [0], 2026)])
+    # Rust has no bit, so nobody can match it, but it is still half of what the job asks for
+    job = {"job_type": "fulltime", "required_skills": ["Python", "Rust"]}
+    scores, _ = candidate_scores(matrix, job, [0], JUNE_30)
+    extra = MATCH_WEIGHTS["extra_skills"] / EXTRA_SKILLS_CAP
+    assert scores.tolist() == pytest.approx([0.3 + 0.3 + extra, 0.3 + 0.3])
+
+
+def test_no_required_skills_means_full_coverage():
+    matrix = student_matrix([("a", [3], 2026)])
+    scores, _ = candidate_scores(matrix, {"job_type": "fulltime", "required_skills": []}, [], JUNE_30)
+    assert scores.tolist() == pytest.approx([0.6 + 0.3 + MATCH_WEIGHTS["extra_skills"] / EXTRA_SKILLS_CAP])
+
+
+def test_extra_skills_are_capped():
+    matrix = student_matrix([("many", list(range(1, 40)), 2026), ("cap", list(range(1, EXTRA_SKILLS_CAP + 1)), 2026)])
+    scores, _ = candidate_scores(matrix, {"job_type": "fulltime", "required_skills": ["Python"]}, [0], JUNE_30)
+    assert scores[0] == scores[1] == pytest.approx(0.3 + MATCH_WEIGHTS["extra_skills"])
+
+
+def test_removed_and_ineligible_students_score_minus_infinity():
+    matrix = student_matrix([("final", [0], 2026), ("second", [0], 2028), ("removed", [0], 2026)])
+    matrix.remove("removed")
+    scores, fit = candidate_scores(matrix, {"job_type": "fulltime", "required_skills": ["Python"]}, [0], JUNE_30)
+    assert fit.tolist() == [1.0, 0.0, 1.0]
+    assert np.isfinite(scores).tolist() == [True, False, False]
+
+
+RECOMMENDABLE_JOBS = {
+    "intern-3rd": {"job_type": "internship", "year_level": "3rd", "required_skills": []},
+    "intern-final": {"job_type": "internship", "year_level": "final", "required_skills": []},
+    "intern-any": {"job_type": "internship", "year_level": None, "required_skills": []},
+    "fresher": {"job_type": "fulltime", "experience_level": "fresher", "required_skills": []},
+    "fulltime": {"job_type": "fulltime", "required_skills": []},
+    "experienced": {"job_type": "fulltime", "experience_level": "experienced", "required_skills": []},
+}
+
+
+def job_columns(jobs: dict) -> dict:
+    """Job snapshot columns for the jobs, in insertion order"""
+    matrix = SkillMatrix(job_snapshot.column_types)
+    for job_id, job in jobs.items():
+        matrix.upsert(job_id, [], **_encode_job_row(job))
+    return {name: column[:matrix.size] for name, column in matrix.columns.items()}
+
+
+@pytest.mark.parametrize("study_year, expected", [
+    # Not yet enrolled
+    (0, set()),
+    (1, {"intern-any"}),
+    (3, {"intern-3rd", "intern-any"}),
+    # Final year: final-year and open internships, and fresher full-time roles
+    (4, {"intern-final", "intern-any", "fresher", "fulltime"}),
+    # Graduated: full-time roles only
+    (5, {"fresher", "fulltime", "experienced"}),
+])
+def test_eligible_jobs(study_year, expected):
+    eligible = eligible_jobs(job_columns(RECOMMENDABLE_JOBS), study_year)
+    assert {job_id for job_id, ok in zip(RECOMMENDABLE_JOBS, eligible) if ok} == expected
+
+
+def test_job_rows_count_distinct_required_skills():
+    columns = job_columns({"job": {"job_type": "internship", "required_skills": ["Python", " python", "SQL"]}})
+    assert columns["required_count"].tolist() == [2]
+    assert columns["study_year"].tolist() == [0]
+
+
+def test_top_k_is_best_first_and_stable():
+    scores = np.array([0.5, 0.9, -np.inf, 0.9, 0.1])
+    assert top_k(scores, 3).tolist() == [1, 3, 0]
+    assert top_k(scores, 10).tolist() == [1, 3, 0, 4, 2]
+    assert top_k(scores[:0], 5).tolist() == []
+
+
+def test_upsert_many_matches_upsert():
+    rng = np.random.default_rng(7)
+    ids = [f"s{i}" for i in range(300)]
+    # Duplicate bits within a row, empty rows, and bits past the first 64-bit word
+    bits = [rng.integers(0, 150, rng.integers(0, 8)).tolist() for _ in ids]
+    bits[0] = [5, 5, 5]
+    bits[1] = []
+    years = rng.integers(2024, 2031, len(ids)).astype(np.int32)
+
+    one_by_one = SkillMatrix({"year_of_passout": np.int32})
+    for doc_id, row_bits, year in zip(ids, bits, years):
+        one_by_one.upsert(doc_id, row_bits, year_of_passout=year)
+    batched = SkillMatrix({"year_of_passout": np.int32})
+    for start in range(0, len(ids), 64):
+        batched.upsert_many(ids[start:start + 64], bits[start:start + 64], {"year_of_passout": years[start:start + 64]})
+
+    assert_same_matrix(one_by_one, batched)
+
+    # Updating existing rows in a batch, including one that widens the matrix
+    updated_ids = ids[::3]
+    updated_bits = [[200, 3] if i == 0 else rng.integers(0, 150, 4).tolist() for i in range(len(updated_ids))]
+    updated_years = np.full(len(updated_ids), 2027, dtype=np.int32)
+    for doc_id, row_bits in zip(updated_ids, updated_bits):
+        one_by_one.upsert(doc_id, row_bits, year_of_passout=2027)
+    batched.upsert_many(updated_ids, updated_bits, {"year_of_passout": updated_years})
+
+    assert_same_matrix(one_by_one, batched)
+    assert one_by_one.skill_counts[0] == 2
+
+
+def assert_same_matrix(expected: SkillMatrix, actual: SkillMatrix):
+    assert actual.ids == expected.ids and actual.rows == expected.rows and actual.size == expected.size
+    width = max(expected.width, actual.width)
+    for matrix in (expected, actual):
+        matrix._reserve(matrix.size, width)
+    assert np.array_equal(actual.words[:actual.size], expected.words[:expected.size])
+    assert np.array_equal(actual.skill_counts[:actual.size], expected.skill_counts[:expected.size])
+    assert np.array_equal(actual.active[:actual.size], expected.active[:expected.size])
+    assert np.array_equal(actual.columns["year_of_passout"][:actual.size], expected.columns["year_of_passout"][:expected.size])
@@ -0,0 +1,61 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from server import PasswordHashingPool
+
+
+def slow_hash(value):
+    time.sleep(0.01)
+    return value.upper()
+
+
+def test_request_pool_sheds_load_when_saturated():
+    pool = PasswordHashingPool(workers=1, max_queue=1)
+
+    async def burst():
+        return await asyncio.gather(*(pool.run(slow_hash, f"p{i}") for i in range(5)), return_exceptions=True)
+
+    try:
+        results = asyncio.run(burst())
+    finally:
+        pool.shutdown()
+    rejected = [result for result in results if isinstance(result, HTTPException)]
+    assert [result for result in results if not isinstance(result, Exception)] == ["P0", "P1"]
+    assert len(rejected) == 3 and all(error.status_code == 503 for error in rejected)
+    assert pool.stats()["rejected"] == 3
+
+
+def test_background_pool_waits_for_capacity():
+    pool = PasswordHashingPool(workers=1, max_queue=1, shed_load=False)
+
+    async def two_imports():
+        # Two chunks scheduled at once, as when two imports run concurrently
+        chunks = [[pool.run(slow_hash, f"{name}{i}") for i in range(4)] for name in ("a", "b")]
+        return await asyncio.gather(*(asyncio.gather(*chunk) for chunk in chunks))
+
+    try:
+        results = asyncio.run(two_imports())
+    finally:
+        pool.shutdown()
+    assert results == [["A0", "A1", "A2", "A3"], ["B0", "B1", "B2", "B3"]]
+    stats = pool.stats()
+    assert stats["rejected"] == 0 and stats["completed"] == 8
+    assert stats["in_flight"] == 0 and stats["waiting"] == 0
+
+
+@pytest.mark.parametrize("shed_load", [True, False])
+def test_pool_releases_slots_on_errors(shed_load):
+    pool = PasswordHashingPool(workers=1, max_queue=0, shed_load=shed_load)
+
+    async def failing_then_ok():
+        with pytest.raises(ValueError):
+            await pool.run(int, "not a number")
+        return await pool.run(slow_hash, "ok")
+
+    try:
+        assert asyncio.run(failing_then_ok()) == "OK"
+    finally:
+        pool.shutdown()
@@ -0,0 +1,138 @@
+import asyncio
+
+import orjson
+import pytest
+
+from server import ResponseCache, serialize_with_etag, splice_sections
+
+
+class Source:
+    """Stand-in for a collection read, counting how often the cache builds from it"""
+    def __init__(self, value):
+        self.value = value
+        self.builds = 0
+
+    async def __call__(self):
+        self.builds += 1
+        return self.value
+
+
+def respond(cache, source, if_none_match=None, namespace="courses", key=()):
+    return asyncio.run(cache.respond(namespace, key, if_none_match, source))
+
+
+@pytest.fixture
+def cache():
+    return ResponseCache(maxsize=16, ttl=60)
+
+
+def test_serialize_with_etag_is_content_addressed():
+    etag, body = serialize_with_etag([{"title": "SQL Basics"}])
+    assert orjson.loads(body) == [{"title": "SQL Basics"}]
+    assert etag.startswith('W/"') and etag == serialize_with_etag([{"title": "SQL Basics"}])[0]
+    assert etag != serialize_with_etag([{"title": "Python Basics"}])[0]
+
+
+def test_respond_serves_body_with_etag(cache):
+    source = Source([{"title": "SQL Basics"}])
+    response = respond(cache, source)
+    assert response.status_code == 200
+    assert orjson.loads(response.body) == source.value
+    assert response.headers["etag"] == serialize_with_etag(source.value)[0]
+    assert response.headers["cache-control"] == "no-cache"
+
+
+@pytest.mark.parametrize("if_none_match", [
+    "{etag}",
+    'W/"stale", {etag}',
+    '{etag},W/"other"',
+])
+def test_matching_if_none_match_is_not_modified(cache, if_none_match):
+    source = Source([{"title": "SQL Basics"}])
+    etag = respond(cache, source).headers["etag"]
+    response = respond(cache, source, if_none_match.format(etag=etag))
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == etag
+    # Revalidation is answered from the cached entry
+    assert source.builds == 1
+
+
+def test_stale_if_none_match_gets_full_body(cache):
+    source = Source([{"title": "SQL Basics"}])
+    response = respond(cache, source, 'W/"stale"')
+    assert response.status_code == 200
+    assert orjson.loads(response.body) == source.value
+
+
+def test_bump_rebuilds_and_changes_etag(cache):
+    source = Source([{"title": "SQL Basics"}])
+    etag = respond(cache, source).headers["etag"]
+
+    # Without a bump the cached body is served even though the source changed
+    source.value = [{"title": "SQL Basics"}, {"title": "Python Basics"}]
+    assert respond(cache, source, etag).status_code == 304
+
+    cache.bump("courses")
+    response = respond(cache, source, etag)
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert orjson.loads(response.body) == source.value
+    assert source.builds == 2
+
+
+def test_bump_without_changes_keeps_etag(cache):
+    source = Source([{"title": "SQL Basics"}])
+    etag = respond(cache, source).headers["etag"]
+    cache.bump("courses")
+    assert respond(cache, source, etag).status_code == 304
+    assert source.builds == 2
+
+
+def test_bump_is_per_namespace(cache):
+    courses, jobs = Source(["course"]), Source(["job"])
+    respond(cache, courses, namespace="courses")
+    respond(cache, jobs, namespace="jobs", key=(None, 100))
+
+    cache.bump("jobs")
+    respond(cache, courses, namespace="courses")
+    respond(cache, jobs, namespace="jobs", key=(None, 100))
+    assert (courses.builds, jobs.builds) == (1, 2)
+
+
+def test_keys_are_cached_separately(cache):
+    first, second = Source(["first page"]), Source(["second page"])
+    assert orjson.loads(respond(cache, first, namespace="jobs", key=(None, 100)).body) == ["first page"]
+    assert orjson.loads(respond(cache, second, namespace="jobs", key=("cursor", 100)).body) == ["second page"]
+
+
+DASHBOARD_SECTIONS = {
+    "profile": {"id": "s1", "name": "Asha \"AJ\" Rao", "completed_skills": ["SQL", "C++"]},
+    "courses": [{"title": "SQL Basics", "description": "Joins, <b>indexes</b> & views"}],
+    "jobs": {"jobs": [], "next_cursor": None},
+    "applications": [],
+}
+
+
+def test_splice_sections_parses():
+    sections = {name: serialize_with_etag(value) for name, value in DASHBOARD_SECTIONS.items()}
+    assert orjson.loads(splice_sections(sections, set())) == {
+        name: {"etag": sections[name][0], "data": value} for name, value in DASHBOARD_SECTIONS.items()
+    }
+
+
+def test_splice_sections_marks_known_etags_not_modified():
+    sections = {name: serialize_with_etag(value) for name, value in DASHBOARD_SECTIONS.items()}
+    known = {sections["courses"][0], sections["applications"][0], 'W/"stale"'}
+    spliced = orjson.loads(splice_sections(sections, known))
+    assert spliced["courses"] == {"etag": sections["courses"][0], "not_modified": True}
+    assert spliced["applications"] == {"etag": sections["applications"][0], "not_modified": True}
+    assert spliced["profile"] == {"etag": sections["profile"][0], "data": DASHBOARD_SECTIONS["profile"]}
+    assert spliced["jobs"] == {"etag": sections["jobs"][0], "data": DASHBOARD_SECTIONS["jobs"]}
+
+
+def test_splice_sections_all_known():
+    sections = {name: serialize_with_etag(value) for name, value in DASHBOARD_SECTIONS.items()}
+    spliced = orjson.loads(splice_sections(sections, {etag for etag, _ in sections.values()}))
+    assert all(section["not_modified"] is True and "data" not in section for section in spliced.values())
+    assert list(spliced) == list(DASHBOARD_SECTIONS)